@@ -1,11 +1,20 @@
 """Configuration management for Gemini MCP Server."""
 
+import functools
 from pathlib import Path
-from typing import Literal
+from typing import Annotated, Any, Literal
 
-from pydantic import field_validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
+# Storage path fields and their default location relative to ~/.gemini-mcp
+_PATH_DEFAULTS = {
+    "data_dir": "",
+    "context_cache_dir": "context-cache",
+    "debate_storage_dir": "debates",
+    "log_dir": "logs",
+}
+
 
 class GeminiMCPConfig(BaseSettings):
     """Configuration for Gemini MCP Server.
@@ -19,7 +28,7 @@ class GeminiMCPConfig(BaseSettings):
     # =========================================================================
     server_name: str = "gemini-mcp"
     server_host: str = "0.0.0.0"
-    server_port: int = 8765
+    server_port: Annotated[int, Field(ge=1, le=65535)] = 8765
     transport: Literal["stdio", "sse", "streamable-http"] = "stdio"
 
     # =========================================================================
@@ -36,7 +45,7 @@ class GeminiMCPConfig(BaseSettings):
     reasoning_timeout: int = 900  # 15 minutes for deep reasoning
 
     # Context settings (Gemini has 1M token window)
-    max_context_tokens: int = 900_000  # Leave buffer from 1M
+    max_context_tokens: Annotated[int, Field(ge=1000)] = 900_000  # Leave buffer from 1M
 
     # =========================================================================
     # Feature Toggles
@@ -53,8 +62,8 @@ class GeminiMCPConfig(BaseSettings):
     # =========================================================================
     # Debate Settings
     # =========================================================================
-    debate_max_rounds: int = 10
-    debate_min_rounds: int = 3
+    debate_max_rounds: Annotated[int, Field(ge=1)] = 10
+    debate_min_rounds: Annotated[int, Field(ge=1)] = 3
     debate_novelty_threshold: float = 0.2
     debate_repetition_threshold: float = 0.7
     debate_turn_timeout: int = 180
@@ -62,28 +71,33 @@ class GeminiMCPConfig(BaseSettings):
     # =========================================================================
     # Swarm Settings
     # =========================================================================
-    swarm_max_depth: int = 3  # Maximum recursion depth
-    swarm_max_agents: int = 10  # Maximum concurrent agents
+    swarm_max_depth: Annotated[int, Field(ge=1, le=20)] = 3  # Maximum recursion depth
+    swarm_max_agents: Annotated[int, Field(ge=1, le=50)] = 10  # Maximum concurrent agents
 
     # =========================================================================
     # Internal Limits (previously hardcoded)
     # =========================================================================
     # Maximum delegation turns per swarm mission
-    swarm_max_turns: int = 10
+    swarm_max_turns: Annotated[int, Field(ge=1)] = 10
     # Maximum trace files before oldest-pruned disk quota
     max_trace_files: int = 500
     # Maximum debate files before oldest-pruned disk quota
     max_debate_files: int = 500
     # Result truncation length (chars) for swarm trace results
     result_truncation_chars: int = 2000
+    # Delegation results kept verbatim in the architect prompt; older ones are
+    # reduced to a short excerpt in an "earlier results" section
+    swarm_history_window: Annotated[int, Field(ge=1)] = 4
 
     # =========================================================================
     # Storage Paths
     # =========================================================================
-    data_dir: Path = Path.home() / ".gemini-mcp"
-    context_cache_dir: Path = Path.home() / ".gemini-mcp" / "context-cache"
-    debate_storage_dir: Path = Path.home() / ".gemini-mcp" / "debates"
-    log_dir: Path = Path.home() / ".gemini-mcp" / "logs"
+    # Defaults live under ~/.gemini-mcp and are filled in by _default_paths
+    # at construction time, so importing this module never resolves $HOME.
+    data_dir: Path = Path()
+    context_cache_dir: Path = Path()
+    debate_storage_dir: Path = Path()
+    log_dir: Path = Path()
 
     # =========================================================================
     # Security
@@ -110,99 +124,116 @@ class GeminiMCPConfig(BaseSettings):
     # Rate Limiting
     # =========================================================================
     # Requests per minute per client IP (0 = disabled)
-    rate_limit: int = 0
+    rate_limit: Annotated[int, Field(ge=0)] = 0
     # Burst capacity (max concurrent before throttling)
-    rate_limit_burst: int = 20
+    rate_limit_burst: Annotated[int, Field(ge=0)] = 20
+    # Add X-RateLimit-Limit / X-RateLimit-Remaining to allowed responses
+    rate_limit_headers: bool = True
     # Maximum request body size in bytes (0 = unlimited, default 10MB)
-    max_request_size: int = 10 * 1024 * 1024
+    max_request_size: Annotated[int, Field(ge=0)] = 10 * 1024 * 1024
 
     # =========================================================================
     # Logging
     # =========================================================================
-    log_level: str = "INFO"
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
     log_usage: bool = True
-    # Enable structured JSON audit logging for tool invocations
+    # Enable structured JSON audit logging for tool invocations (read at startup)
     audit_log: bool = False
 
     # =========================================================================
-    # Validators — bounds checking for numeric / enum fields
+    # Parsed forms — split once per config instance, on first access
     # =========================================================================
-    @field_validator("server_port")
-    @classmethod
-    def _port_range(cls, v: int) -> int:
-        if not (1 <= v <= 65535):
-            raise ValueError(f"server_port must be 1-65535, got {v}")
-        return v
-
-    @field_validator(
-        "timeout",
-        "activity_timeout",
-        "reasoning_timeout",
-        "debate_turn_timeout",
-        "parallel_search_timeout",
-    )
-    @classmethod
-    def _positive_timeout(cls, v: int) -> int:
-        if v < 1:
-            raise ValueError(f"Timeout must be >= 1 second, got {v}")
-        return v
-
-    @field_validator("max_context_tokens")
-    @classmethod
-    def _token_limit(cls, v: int) -> int:
-        if v < 1000:
-            raise ValueError(f"max_context_tokens must be >= 1000, got {v}")
-        return v
-
-    @field_validator("debate_novelty_threshold", "debate_repetition_threshold")
-    @classmethod
-    def _threshold_range(cls, v: float) -> float:
-        if not (0.0 <= v <= 1.0):
-            raise ValueError(f"Threshold must be 0.0-1.0, got {v}")
-        return v
-
-    @field_validator("swarm_max_depth")
-    @classmethod
-    def _depth_range(cls, v: int) -> int:
-        if not (1 <= v <= 20):
-            raise ValueError(f"swarm_max_depth must be 1-20, got {v}")
-        return v
+    @functools.cached_property
+    def plugin_allowlist_set(self) -> frozenset[str] | None:
+        """Plugin filenames from ``plugin_allowlist``.
 
-    @field_validator("swarm_max_agents")
-    @classmethod
-    def _agents_range(cls, v: int) -> int:
-        if not (1 <= v <= 50):
-            raise ValueError(f"swarm_max_agents must be 1-50, got {v}")
-        return v
+        ``None`` when the allowlist is unset (allow all). A configured list
+        that names no files (e.g. ``", ,"``) is an empty set and blocks all.
+        """
+        if not self.plugin_allowlist.strip():
+            return None
+        return frozenset(n.strip() for n in self.plugin_allowlist.split(",") if n.strip())
 
-    @field_validator("log_level")
-    @classmethod
-    def _valid_log_level(cls, v: str) -> str:
-        valid = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        if v.upper() not in valid:
-            raise ValueError(f"log_level must be one of {valid}, got {v}")
-        return v.upper()
+    @functools.cached_property
+    def allowed_path_roots(self) -> tuple[Path, ...]:
+        """Resolved directories from ``allowed_paths`` (empty = use defaults)."""
+        return tuple(Path(p).resolve() for p in self.allowed_paths.split(":") if p.strip())
 
-    @field_validator("rate_limit", "rate_limit_burst")
+    # =========================================================================
+    # Validation — bounds checking for numeric / enum fields
+    # =========================================================================
+    # Simple ranges and enums are declared on the fields (Field(ge=..., le=...),
+    # Literal) and checked inside pydantic-core.  The remaining checks run in a
+    # single pass after field parsing instead of one Python callback per field.
+    @model_validator(mode="before")
     @classmethod
-    def _non_negative(cls, v: int) -> int:
-        if v < 0:
-            raise ValueError(f"Value must be >= 0, got {v}")
-        return v
-
-    @field_validator("max_request_size")
+    def _default_paths(cls, data: Any) -> Any:
+        if not isinstance(data, dict):
+            return data
+        missing = [name for name in _PATH_DEFAULTS if data.get(name) is None]
+        if not missing:
+            return data
+        base = Path.home() / ".gemini-mcp"
+        data = dict(data)
+        for name in missing:
+            data[name] = base / _PATH_DEFAULTS[name]
+        return data
+
+    @field_validator("log_level", mode="before")
     @classmethod
-    def _request_size(cls, v: int) -> int:
-        if v < 0:
-            raise ValueError(f"max_request_size must be >= 0, got {v}")
-        return v
+    def _upper_log_level(cls, v: object) -> object:
+        return v.upper() if isinstance(v, str) else v
+
+    @model_validator(mode="after")
+    def _validate(self) -> "GeminiMCPConfig":
+        for name in (
+            "timeout",
+            "activity_timeout",
+            "reasoning_timeout",
+            "debate_turn_timeout",
+            "parallel_search_timeout",
+        ):
+            v = getattr(self, name)
+            if v < 1:
+                raise ValueError(f"Timeout must be >= 1 second, got {v} for {name}")
+
+        for name in ("debate_novelty_threshold", "debate_repetition_threshold"):
+            v = getattr(self, name)
+            if not (0.0 <= v <= 1.0):
+                raise ValueError(f"Threshold must be 0.0-1.0, got {v} for {name}")
+
+        return self
 
     model_config = {
         "env_prefix": "GEMINI_MCP_",
         "env_file": ".env",
         "extra": "ignore",
+        # Config is a process-wide singleton; reject mutation after load.
+        "frozen": True,
     }
 
 
-# Global configuration instance
-config = GeminiMCPConfig()
+@functools.cache
+def get_config() -> GeminiMCPConfig:
+    """Return the process-wide configuration, parsing the environment on first use."""
+    return GeminiMCPConfig()
+
+
+class _LazyConfig:
+    """Proxy that defers building ``GeminiMCPConfig`` until a field is read.
+
+    Keeps ``from .config import config`` working at every call site while
+    making ``import gemini_mcp.config`` itself free of env/.env parsing.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_config(), name)
+
+    def __repr__(self) -> str:
+        return repr(get_config())
+
+
+# Global configuration instance (lazily initialized)
+config: GeminiMCPConfig = _LazyConfig()  # type: ignore[assignment]
@@ -1,4 +1,11 @@
-"""Core modules for Gemini MCP Server."""
+"""Core modules for Gemini MCP Server.
+
+Client and response types are resolved lazily (PEP 562) so that importing
+one symbol does not pull in every submodule.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
 from .exceptions import (
     GeminiAPIError,
@@ -6,8 +13,18 @@ from .exceptions import (
     GeminiParseError,
     GeminiTimeoutError,
 )
-from .gemini import GeminiClient, GeminiRequest
-from .response import GeminiResponse, GeminiStats
+
+if TYPE_CHECKING:
+    from .gemini import GeminiClient, GeminiRequest
+    from .response import GeminiResponse, GeminiStats
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    "GeminiClient": "gemini",
+    "GeminiRequest": "gemini",
+    "GeminiResponse": "response",
+    "GeminiStats": "response",
+}
 
 __all__ = [
     "GeminiClient",
@@ -19,3 +36,16 @@ __all__ = [
     "GeminiParseError",
     "GeminiTimeoutError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,27 +1,201 @@
 """Gemini API client using the google-genai SDK."""
 
+import asyncio
+import functools
+import io
 import json
 import logging
 import os
 import threading
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-from google import genai
-from google.genai import types
-from google.oauth2.credentials import Credentials
-
-from ..config import config
+from ..config import get_config
 from .exceptions import GeminiAPIError, GeminiParseError
 from .response import GeminiResponse, GeminiStats
 
+if TYPE_CHECKING:
+    import httpx
+    from google import genai
+    from google.auth.transport.requests import Request
+    from google.genai import types
+    from google.oauth2.credentials import Credentials
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# ---------------------------------------------------------------------------
+# Event timestamps — formatted at most once per wall-clock second
+# ---------------------------------------------------------------------------
+_TS_FMT = "%Y-%m-%dT%H:%M:%SZ"
+_ts_cache: tuple[int, str] = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as ISO-8601, reusing the string within a second."""
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, time.strftime(_TS_FMT, time.gmtime(now)))
+    return _ts_cache[1]
+
+
+# ---------------------------------------------------------------------------
+# Generation config — reused across requests with identical parameters
+# ---------------------------------------------------------------------------
+_KNOWN_MODELS = ("gemini-3-pro-preview", "gemini-3-flash-preview")
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_gen_config(
+    temperature: float | None,
+    max_output_tokens: int | None,
+    system_instruction: str | None,
+) -> "types.GenerateContentConfig":
+    from google.genai import types
+
+    return types.GenerateContentConfig(
+        temperature=temperature,
+        max_output_tokens=max_output_tokens,
+        system_instruction=system_instruction,
+    )
+
+
+def _build_gen_config(request: "GeminiRequest") -> "types.GenerateContentConfig":
+    """Return a GenerateContentConfig for *request*.
+
+    The common case (no tools or safety settings) is served from an LRU cache
+    keyed on the scalar parameters, so debate rounds and swarm turns that
+    repeat the same temperature/system prompt skip re-validation.  Each caller
+    gets its own (unvalidated, shallow) copy of the cached config, so changes
+    made downstream never leak into later requests.  Requests carrying tools
+    or safety settings always get a fresh config.
+    """
+    if request.tools is None and request.safety_settings is None:
+        return _cached_gen_config(
+            request.temperature, request.max_output_tokens, request.system_instruction
+        ).model_copy()
+
+    from google.genai import types
+
+    return types.GenerateContentConfig(
+        temperature=request.temperature,
+        max_output_tokens=request.max_output_tokens,
+        system_instruction=request.system_instruction,
+        tools=request.tools,
+        safety_settings=request.safety_settings,
+    )
+
+
+def _is_auth_error(exc: Exception, message: str) -> bool:
+    """Return True if *exc* looks like an authentication failure.
+
+    google-genai ``APIError`` carries the HTTP status as ``code``; other
+    exceptions fall back to scanning the already-formatted *message*.
+    """
+    code = getattr(exc, "code", None)
+    if isinstance(code, int):
+        return code == 401
+    return "401" in message or "Unauthenticated" in message
+
+
+# ---------------------------------------------------------------------------
+# GCP project-ID cache (stale-while-revalidate)
+# ---------------------------------------------------------------------------
+_PROJECT_CACHE_NAME = "project_id.cache"
+_PROJECT_CACHE_TTL = 24 * 3600  # seconds before a background refresh is due
+
+
+def _read_project_cache(cache_file: Path) -> tuple[str | None, bool]:
+    """Return ``(project_id, is_fresh)`` from the on-disk cache."""
+    try:
+        data = json.loads(cache_file.read_text())
+        project_id = data["project_id"]
+        fresh = time.time() - data.get("fetched_at", 0) < _PROJECT_CACHE_TTL
+        return project_id, fresh
+    except (OSError, ValueError, KeyError, TypeError):
+        return None, False
+
+
+def _write_project_cache(cache_file: Path, project_id: str) -> None:
+    """Persist a discovered project ID with its fetch time."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({"project_id": project_id, "fetched_at": time.time()}))
+    except OSError as e:
+        logger.warning(f"Failed to write project cache: {e}")
+
+
+# Pooled HTTP clients for project discovery, so repeated refreshes reuse the
+# keep-alive connection instead of paying a fresh TLS handshake each time.
+_http_client: "httpx.AsyncClient | None" = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+_http_client_closers: set[asyncio.Task[None]] = set()
+
+
+async def _close_http_client(client: "httpx.AsyncClient") -> None:
+    """Close a replaced HTTP client, logging rather than raising on failure."""
+    try:
+        await client.aclose()
+    except Exception as e:
+        logger.debug(f"Failed to close stale HTTP client: {e}")
+
+
+def _retire_http_client(
+    client: "httpx.AsyncClient", client_loop: asyncio.AbstractEventLoop | None
+) -> None:
+    """Close *client* on its own loop if that loop still runs, else on this one."""
+    if client_loop is not None and client_loop.is_running() and not client_loop.is_closed():
+        asyncio.run_coroutine_threadsafe(_close_http_client(client), client_loop)
+        return
+    task = asyncio.get_running_loop().create_task(_close_http_client(client))
+    _http_client_closers.add(task)
+    task.add_done_callback(_http_client_closers.discard)
+
+
+def _get_http_client() -> "httpx.AsyncClient":
+    """Return the shared async HTTP client for the running event loop.
+
+    httpx connections are bound to the loop that opened them, so the client
+    is recreated if a different loop is now running; the old one is closed.
+    """
+    global _http_client, _http_client_loop
+    import httpx
+
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client_loop is not loop:
+        stale, stale_loop = _http_client, _http_client_loop
+        _http_client = httpx.AsyncClient(timeout=3.0)
+        _http_client_loop = loop
+        if stale is not None:
+            _retire_http_client(stale, stale_loop)
+    return _http_client
+
+
+@functools.lru_cache(maxsize=1)
+def _auth_request() -> "Request":
+    """Shared google-auth transport (one ``requests.Session``) for token refresh."""
+    from google.auth.transport.requests import Request
+
+    return Request()
+
+
+@functools.lru_cache(maxsize=1)
+def _read_creds_file(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse the CLI OAuth credentials file.
+
+    Keyed on modification time so the JSON is only re-read when the Gemini
+    CLI rewrites the file; token refresh is left to the Credentials object.
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
+@dataclass(slots=True, frozen=True)
 class GeminiRequest:
     """Request configuration for Gemini API.
 
@@ -46,12 +220,16 @@ class GeminiRequest:
     safety_settings: Any | None = None
 
 
-@dataclass
+# Shared read-only default for events constructed without a payload
+_EMPTY_DATA: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(slots=True, frozen=True)
 class StreamEvent:
     """Event from streaming response."""
 
     type: str  # init, message, tool_use, tool_result, result, error
-    data: dict = field(default_factory=dict)
+    data: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_DATA)
     timestamp: str = ""
 
 
@@ -61,12 +239,50 @@ class GeminiClient:
     def __init__(self) -> None:
         """Initialize the Gemini client.
 
+        Construction is cheap: only model names are read from config.  The
+        underlying ``genai.Client`` (credential loading, optional project
+        discovery) is built on first use — see :meth:`_ensure_client`.
+        """
+        cfg = get_config()
+        self.default_model = cfg.default_model
+        self.fast_model = cfg.fast_model
+        self.include_stats = cfg.log_usage
+        # Configured models first, then the well-known defaults (deduplicated)
+        self._available_models = tuple(
+            dict.fromkeys((self.default_model, self.fast_model, *_KNOWN_MODELS))
+        )
+
+        self._client: genai.Client | None = None
+        self._client_ready = False
+        self._client_lock = threading.Lock()
+        self._refresh_task: asyncio.Task[None] | None = None
+
+    @property
+    def client(self) -> "genai.Client | None":
+        """The underlying genai client, or None if initialization failed."""
+        return self._ensure_client()
+
+    def _ensure_client(self) -> "genai.Client | None":
+        """Create the genai client on first use (thread-safe)."""
+        if not self._client_ready:
+            with self._client_lock:
+                if not self._client_ready:
+                    self._client = self._create_client()
+                    self._client_ready = True
+        return self._client
+
+    def _create_client(self) -> "genai.Client | None":
+        """Resolve authentication and build the genai client.
+
         Prioritizes GOOGLE_API_KEY environment variable.
         Falls back to Gemini CLI OAuth credentials if available.
         Attempts to auto-discover GCP project for Vertex AI if using OAuth.
         """
-        self.default_model = config.default_model
-        self.fast_model = config.fast_model
+        # Imported here: google-genai pulls in a large dependency tree that
+        # importers of this module (tests, tool schemas) should not pay for.
+        from google import genai
+
+        cfg = get_config()
 
         api_key = os.getenv("GOOGLE_API_KEY")
         credentials = None
@@ -77,9 +293,14 @@ class GeminiClient:
             if credentials:
                 logger.info("Loaded Gemini CLI OAuth credentials")
 
-                # Auto-discover project if not set and opt-in enabled
-                if not project_id and config.auto_discover_project:
-                    project_id = self._fetch_project_id(credentials)
+                # Auto-discover project if not set and opt-in enabled.
+                # Stale-while-revalidate: use the cached ID immediately and
+                # refresh it in the background so startup never blocks on HTTP.
+                if not project_id and cfg.auto_discover_project:
+                    cache_file = cfg.data_dir / _PROJECT_CACHE_NAME
+                    project_id, fresh = _read_project_cache(cache_file)
+                    if not fresh:
+                        self._schedule_project_refresh(credentials, cache_file, project_id)
                 elif not project_id:
                     logger.debug(
                         "GCP project auto-discovery disabled. "
@@ -98,11 +319,11 @@ class GeminiClient:
         # Initialize client
         try:
             if api_key:
-                self.client = genai.Client(api_key=api_key)
+                client = genai.Client(api_key=api_key)
                 logger.info("Authenticated using API key (Developer API)")
             elif credentials and project_id:
                 # OAuth credentials typically require Vertex AI mode in google-genai v1.x
-                self.client = genai.Client(
+                client = genai.Client(
                     credentials=credentials,
                     vertexai=True,
                     project=project_id,
@@ -111,32 +332,56 @@ class GeminiClient:
                 logger.info("Authenticated using OAuth credentials (Vertex AI)")
             elif credentials:
                 # Fallback: Try generic init, though this likely fails for Developer API
-                self.client = genai.Client(credentials=credentials)
+                client = genai.Client(credentials=credentials)
                 logger.info("Authenticated using OAuth credentials (Generic)")
             else:
                 # Try without credentials (ADC or unauth)
-                self.client = genai.Client()
+                client = genai.Client()
                 logger.info("Initialized client with Application Default Credentials")
         except Exception as e:
             logger.error(f"Failed to initialize Gemini Client: {e}")
             # We don't raise here to allow the server to start, but requests will fail
-            self.client = None  # type: ignore[assignment]
+            return None
+        return client
 
-    def _fetch_project_id(self, creds: Credentials) -> str | None:
+    def _schedule_project_refresh(
+        self, creds: "Credentials", cache_file: Path, current: str | None
+    ) -> None:
+        """Start a background project-ID refresh on the running event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.debug("No running event loop; skipping GCP project refresh")
+            return
+        if current is None:
+            logger.info("No cached GCP project yet; discovering in the background")
+        self._refresh_task = loop.create_task(self._refresh_project_id(creds, cache_file, current))
+
+    async def _refresh_project_id(
+        self, creds: "Credentials", cache_file: Path, current: str | None
+    ) -> None:
+        """Fetch the project ID, persist it, and rebuild the client if it was missing."""
+        project_id = await self._fetch_project_id(creds)
+        if project_id is None:
+            return  # keep serving the stale value
+        _write_project_cache(cache_file, project_id)
+        if current is None:
+            # The client was built without a project — rebuild on next use.
+            with self._client_lock:
+                self._client_ready = False
+            logger.info(f"Discovered GCP project: {project_id}")
+
+    async def _fetch_project_id(self, creds: "Credentials") -> str | None:
         """Fetch the first available project ID using credentials."""
-        import requests
-        from google.auth.transport.requests import Request
-
         try:
             if not creds.valid:
                 logger.info("Refreshing OAuth credentials...")
-                creds.refresh(Request())
+                await asyncio.to_thread(creds.refresh, _auth_request())
 
             url = "https://cloudresourcemanager.googleapis.com/v1/projects"
             headers = {"Authorization": f"Bearer {creds.token}"}
 
-            # Use a short timeout to not block startup
-            resp = requests.get(url, headers=headers, timeout=3.0)
+            resp = await _get_http_client().get(url, headers=headers)
             if resp.status_code == 200:
                 projects = resp.json().get("projects", [])
                 if projects:
@@ -149,15 +394,18 @@ class GeminiClient:
 
         return None
 
-    def _load_cli_credentials(self) -> Credentials | None:
+    def _load_cli_credentials(self) -> "Credentials | None":
         """Load OAuth credentials from Gemini CLI storage."""
+        from google.oauth2.credentials import Credentials
+
         try:
             creds_path = Path.home() / ".gemini" / "oauth_creds.json"
-            if not creds_path.exists():
+            try:
+                mtime_ns = creds_path.stat().st_mtime_ns
+            except FileNotFoundError:
                 return None
 
-            with open(creds_path) as f:
-                data = json.load(f)
+            data = _read_creds_file(str(creds_path), mtime_ns)
 
             return Credentials(
                 token=data.get("access_token"),
@@ -171,11 +419,15 @@ class GeminiClient:
             logger.warning(f"Failed to load Gemini CLI credentials: {e}")
             return None
 
-    async def generate(self, request: GeminiRequest) -> GeminiResponse:
+    async def generate(
+        self, request: GeminiRequest, include_stats: bool | None = None
+    ) -> GeminiResponse:
         """Generate content using Gemini API.
 
         Args:
             request: Request configuration
+            include_stats: Attach token usage stats to the response
+                (default: ``config.log_usage``)
 
         Returns:
             GeminiResponse with generated content
@@ -185,40 +437,38 @@ class GeminiClient:
             GeminiParseError: If response parsing fails
         """
         model = request.model or self.default_model
-        start_time = time.time()
+        start_time = time.monotonic()
 
-        if self.client is None:
+        client = self.client
+        if client is None:
             raise GeminiAPIError(
                 "Gemini client not initialized. Check authentication configuration."
             )
 
         try:
             # Configure generation
-            gen_config = types.GenerateContentConfig(
-                temperature=request.temperature,
-                max_output_tokens=request.max_output_tokens,
-                system_instruction=request.system_instruction,
-                tools=request.tools,
-                safety_settings=request.safety_settings,
-            )
+            gen_config = _build_gen_config(request)
 
             # Execute request
-            response = await self.client.aio.models.generate_content(
+            response = await client.aio.models.generate_content(
                 model=model,
                 contents=request.prompt,
                 config=gen_config,
             )
 
-            elapsed = time.time() - start_time
-            return self._parse_response(response, elapsed, model)
+            elapsed = time.monotonic() - start_time
+            if include_stats is None:
+                include_stats = self.include_stats
+            return self._parse_response(response, elapsed, model, include_stats)
 
         except GeminiAPIError:
             raise
         except Exception as e:
-            logger.error(f"Gemini API error: {e}")
-            if "401" in str(e) or "Unauthenticated" in str(e):
+            message = str(e)
+            logger.error("Gemini API error: %s", message)
+            if _is_auth_error(e, message):
                 logger.error("Authentication failed. Run 'gemini login' or set GOOGLE_API_KEY")
-            raise GeminiAPIError(f"API request failed: {e}") from e
+            raise GeminiAPIError(f"API request failed: {message}") from e
 
     async def stream(self, request: GeminiRequest) -> AsyncIterator[StreamEvent]:
         """Stream content generation.
@@ -233,53 +483,49 @@ class GeminiClient:
             GeminiAPIError: If API call fails
         """
         model = request.model or self.default_model
-        start_time = time.time()
+        start_time = time.monotonic()
 
-        if self.client is None:
+        client = self.client
+        if client is None:
             raise GeminiAPIError(
                 "Gemini client not initialized. Check authentication configuration."
             )
 
         try:
-            gen_config = types.GenerateContentConfig(
-                temperature=request.temperature,
-                max_output_tokens=request.max_output_tokens,
-                system_instruction=request.system_instruction,
-                tools=request.tools,
-                safety_settings=request.safety_settings,
-            )
+            gen_config = _build_gen_config(request)
 
             # Yield init event
             yield StreamEvent(
                 type="init",
                 data={"model": model},
-                timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                timestamp=_utc_timestamp(),
             )
 
             # Stream response
-            accumulated_text = []
-            async for chunk in await self.client.aio.models.generate_content_stream(
+            accumulated_text = io.StringIO()
+            async for chunk in await client.aio.models.generate_content_stream(
                 model=model,
                 contents=request.prompt,
                 config=gen_config,
             ):
-                if hasattr(chunk, "text") and chunk.text:
-                    accumulated_text.append(chunk.text)
+                text = getattr(chunk, "text", None)
+                if text:
+                    accumulated_text.write(text)
                     yield StreamEvent(
                         type="message",
-                        data={"role": "assistant", "content": chunk.text},
-                        timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                        data={"role": "assistant", "content": text},
+                        timestamp=_utc_timestamp(),
                     )
 
             # Yield final result
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             yield StreamEvent(
                 type="result",
                 data={
-                    "response": "".join(accumulated_text),
+                    "response": accumulated_text.getvalue(),
                     "elapsed_seconds": elapsed,
                 },
-                timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                timestamp=_utc_timestamp(),
             )
 
         except Exception as e:
@@ -287,23 +533,28 @@ class GeminiClient:
             yield StreamEvent(
                 type="error",
                 data={"error": str(e)},
-                timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                timestamp=_utc_timestamp(),
             )
             raise GeminiAPIError(f"Streaming failed: {e}") from e
 
-    def _parse_response(self, response: Any, elapsed: float, model: str) -> GeminiResponse:
+    def _parse_response(
+        self, response: Any, elapsed: float, model: str, include_stats: bool = True
+    ) -> GeminiResponse:
         """Parse API response into GeminiResponse."""
         try:
-            text = response.text if hasattr(response, "text") else ""
-
-            # Extract usage metadata
-            usage = getattr(response, "usage_metadata", None)
-            stats = GeminiStats(
-                prompt_tokens=getattr(usage, "prompt_token_count", 0) if usage else 0,
-                response_tokens=(getattr(usage, "candidates_token_count", 0) if usage else 0),
-                total_tokens=getattr(usage, "total_token_count", 0) if usage else 0,
-                duration_ms=int(elapsed * 1000),
-            )
+            text = getattr(response, "text", "")
+
+            # Extract usage metadata (skipped entirely when stats aren't wanted)
+            # (missing metadata gives zero token counts but a real duration)
+            stats: GeminiStats | None = None
+            if include_stats:
+                usage = getattr(response, "usage_metadata", None)
+                stats = GeminiStats(
+                    prompt_tokens=getattr(usage, "prompt_token_count", 0),
+                    response_tokens=getattr(usage, "candidates_token_count", 0),
+                    total_tokens=getattr(usage, "total_token_count", 0),
+                    duration_ms=int(elapsed * 1000),
+                )
 
             return GeminiResponse(
                 text=text,
@@ -317,12 +568,7 @@ class GeminiClient:
 
     def get_available_models(self) -> list[str]:
         """Get list of available models."""
-        return [
-            self.default_model,
-            self.fast_model,
-            "gemini-3-pro-preview",
-            "gemini-3-flash-preview",
-        ]
+        return list(self._available_models)
 
 
 # Global client instance (thread-safe via double-checked locking)
@@ -1,9 +1,45 @@
 """Response types for Gemini MCP Server."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Final
 
+# Shared read-only default for GeminiResponse.raw, so responses without raw
+# payloads don't each allocate an empty dict.
+_EMPTY_RAW: Final[Mapping[str, Any]] = MappingProxyType({})
 
-@dataclass
+# API-style (camelCase) keys accepted by from_dict, mapped to field names.
+# A field's own key always wins over its alias.
+_STATS_ALIASES: Final = {
+    "promptTokenCount": "prompt_tokens",
+    "candidatesTokenCount": "response_tokens",
+    "totalTokenCount": "total_tokens",
+}
+_STATS_FIELDS: Final = frozenset(
+    {"prompt_tokens", "response_tokens", "total_tokens", "duration_ms"}
+)
+_RESPONSE_ALIASES: Final = {"content": "text"}
+_RESPONSE_FIELDS: Final = frozenset(
+    {"text", "error", "raw", "elapsed_seconds", "model", "tool_use"}
+)
+
+
+def _field_kwargs(
+    data: Mapping[str, Any], aliases: Mapping[str, str], fields: frozenset[str]
+) -> dict[str, Any]:
+    """Map *data* onto constructor kwargs in a single pass over its keys."""
+    kwargs: dict[str, Any] = {}
+    for key, value in data.items():
+        name = aliases.get(key)
+        if name is not None:
+            kwargs.setdefault(name, value)
+        elif key in fields:
+            kwargs[key] = value
+    return kwargs
+
+
+@dataclass(slots=True, frozen=True)
 class GeminiStats:
     """Statistics from a Gemini API call."""
 
@@ -15,12 +51,7 @@ class GeminiStats:
     @classmethod
     def from_dict(cls, data: dict) -> "GeminiStats":
         """Create from dictionary."""
-        return cls(
-            prompt_tokens=data.get("prompt_tokens", data.get("promptTokenCount", 0)),
-            response_tokens=data.get("response_tokens", data.get("candidatesTokenCount", 0)),
-            total_tokens=data.get("total_tokens", data.get("totalTokenCount", 0)),
-            duration_ms=data.get("duration_ms", 0),
-        )
+        return cls(**_field_kwargs(data, _STATS_ALIASES, _STATS_FIELDS))
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -32,14 +63,14 @@ class GeminiStats:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class GeminiResponse:
     """Response from a Gemini API call."""
 
     text: str = ""
     stats: GeminiStats | None = None
     error: str | None = None
-    raw: dict = field(default_factory=dict)
+    raw: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_RAW)
     elapsed_seconds: float = 0.0
     model: str = ""
     tool_use: dict | None = None
@@ -69,15 +100,7 @@ class GeminiResponse:
     @classmethod
     def from_dict(cls, data: dict) -> "GeminiResponse":
         """Create from dictionary."""
-        stats = None
+        kwargs = _field_kwargs(data, _RESPONSE_ALIASES, _RESPONSE_FIELDS)
         if "stats" in data:
-            stats = GeminiStats.from_dict(data["stats"])
-        return cls(
-            text=data.get("text", data.get("content", "")),
-            stats=stats,
-            error=data.get("error"),
-            raw=data.get("raw", {}),
-            elapsed_seconds=data.get("elapsed_seconds", 0.0),
-            model=data.get("model", ""),
-            tool_use=data.get("tool_use"),
-        )
+            kwargs["stats"] = GeminiStats.from_dict(data["stats"])
+        return cls(**kwargs)
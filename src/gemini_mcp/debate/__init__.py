@@ -1,5 +1,25 @@
-"""AI-to-AI debate system."""
+"""AI-to-AI debate system.
 
-from .orchestrator import DebateConfig, DebateOrchestrator, DebateResult, DebateStrategy
+Exports are resolved lazily (PEP 562) so importing the package does not
+load the orchestrator and its client dependencies until first use.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .orchestrator import DebateConfig, DebateOrchestrator, DebateResult, DebateStrategy
 
 __all__ = ["DebateOrchestrator", "DebateConfig", "DebateStrategy", "DebateResult"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(".orchestrator", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,16 +1,24 @@
 """Debate orchestrator for AI-to-AI discussions."""
 
+import copy
+import heapq
 import json
 import logging
 import math
+import os
 import re
+import threading
 import time
 import uuid
-from collections import Counter
-from collections.abc import Awaitable, Callable
+from collections import Counter, OrderedDict, deque
+from collections.abc import Awaitable, Callable, Iterator, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+from filelock import FileLock, Timeout
 
 from ..config import config
 from ..core.gemini import GeminiRequest, get_client
@@ -81,17 +89,237 @@ class RelatedDebate:
 _MAX_DEBATE_FILES = config.max_debate_files
 
 
+# ---------------------------------------------------------------------------
+# Parsed-debate cache — keyed by path, validated against (mtime_ns, size)
+# ---------------------------------------------------------------------------
+# Version 2 files persist the topic's TF vector so readers don't re-tokenize;
+# version 1 files (no "schema_version") are tokenized on load.  Early v2 files
+# also carried an unweighted "topic_norm", which IDF weighting made obsolete.
+_DEBATE_SCHEMA_VERSION = 2
+_DERIVED_FIELDS = frozenset({"schema_version", "topic_tf", "topic_norm"})
+
+# Inverted index (topic token -> debate file stems) kept beside the debates.
+# Underscore-prefixed files in the storage dir are metadata, not debates.
+_INDEX_FILE = "_index.json"
+
+# A directory changed this recently may change again within the same
+# timestamp tick, so a catalog scanned then is not trusted on mtime alone.
+_CATALOG_SETTLE_NS = 1_000_000_000
+
+
+@dataclass
+class _TermIndex:
+    """TF-IDF inverted index over debate topics.
+
+    ``docs[stem]`` is a debate topic's TF vector and ``postings[token]`` the
+    TF weight of *token* in each debate containing it.  Document frequencies
+    fall out of the posting-list sizes, so IDF always reflects the current
+    corpus and a query is scored term-at-a-time against every candidate
+    without opening a debate file.  Only ``docs`` is persisted, so it is the
+    sole source of ``N`` and ``df``; ``DebateMemory`` reconciles it with the
+    debate files before use and merges into it under a lock when saving.
+    """
+
+    docs: dict[str, dict[str, float]] = field(default_factory=dict)
+    postings: dict[str, dict[str, float]] = field(default_factory=dict)
+
+    def add(self, stem: str, vec: dict[str, float]) -> None:
+        self.discard({stem})  # re-saved under the same id
+        self.docs[stem] = vec
+        for token, weight in vec.items():
+            self.postings.setdefault(token, {})[stem] = weight
+
+    def discard(self, stems: set[str]) -> None:
+        for stem in stems:
+            for token in self.docs.pop(stem, {}):
+                posting = self.postings.get(token)
+                if posting is not None:
+                    posting.pop(stem, None)
+                    if not posting:
+                        del self.postings[token]
+
+    def idf(self, token: str) -> float:
+        """Smoothed inverse document frequency: ``log((N+1)/(df+1)) + 1``."""
+        df = len(self.postings.get(token, ()))
+        return math.log((len(self.docs) + 1) / (df + 1)) + 1.0
+
+    def weighted(self, vec: dict[str, float]) -> dict[str, float]:
+        """Scale a TF vector by the corpus IDF of each term."""
+        return {token: weight * self.idf(token) for token, weight in vec.items()}
+
+    def cosine_scores(self, query: dict[str, float]) -> dict[str, float]:
+        """TF-IDF cosine similarity of *query* with every debate sharing a token."""
+        query_w = self.weighted(query)
+        query_norm = _vector_norm(query_w)
+        if not query_norm:
+            return {}
+
+        dots: dict[str, float] = {}
+        for token, q_weight in query_w.items():
+            posting = self.postings.get(token)
+            if not posting:
+                continue
+            idf = self.idf(token)
+            for stem, weight in posting.items():
+                dots[stem] = dots.get(stem, 0.0) + q_weight * weight * idf
+
+        scores = {}
+        for stem, dot in dots.items():
+            doc_norm = _vector_norm(self.weighted(self.docs[stem]))
+            if doc_norm:
+                scores[stem] = dot / (query_norm * doc_norm)
+        return scores
+
+    def to_json(self) -> str:
+        return json.dumps({"docs": self.docs})
+
+    @classmethod
+    def from_json(cls, text: str) -> "_TermIndex":
+        index = cls()
+        for stem, vec in json.loads(text)["docs"].items():
+            index.add(stem, vec)
+        return index
+
+
+_debate_cache: OrderedDict[str, tuple[int, int, dict[str, Any], dict[str, float]]] = OrderedDict()
+
+
+def _load_debate_cached(path: Path) -> tuple[dict[str, Any], dict[str, float]]:
+    """Return the parsed debate file plus its topic's TF vector.
+
+    Repeat reads of an unchanged file cost one ``stat()``; a changed mtime or
+    size re-parses it.  Entries are evicted least-recently-used beyond
+    ``_MAX_DEBATE_FILES``.
+    """
+    st = path.stat()
+    key = str(path)
+    entry = _debate_cache.get(key)
+    if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        _debate_cache.move_to_end(key)
+        return entry[2], entry[3]
+
+    with open(path, "rb") as f:
+        data = json.loads(f.read())
+    vec = data.get("topic_tf")
+    if vec is None:
+        vec = _tfidf_vector(data.get("topic", ""))
+    _debate_cache[key] = (st.st_mtime_ns, st.st_size, data, vec)
+    _debate_cache.move_to_end(key)
+    if len(_debate_cache) > _MAX_DEBATE_FILES:
+        _debate_cache.popitem(last=False)
+    return data, vec
+
+
 class DebateMemory:
     """Persistent memory for debates with disk-quota enforcement."""
 
     def __init__(self) -> None:
         self.storage_dir = config.debate_storage_dir
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self._index: _TermIndex | None = None
+        self._index_files: dict[str, int] | None = None
+        self._files: dict[str, int] | None = None
+        self._files_mtime: int | None = None
+
+    def _scan_debate_files(self) -> dict[str, int]:
+        """Map each stored debate's id to its mtime_ns in one directory pass.
+
+        Metadata files such as the index (underscore-prefixed) are skipped.
+        """
+        with os.scandir(self.storage_dir) as entries:
+            return {
+                entry.name.removesuffix(".json"): entry.stat().st_mtime_ns
+                for entry in entries
+                if entry.name.endswith(".json") and not entry.name.startswith("_")
+            }
+
+    def _debate_files(self) -> dict[str, int]:
+        """Return the catalog of debate files, rescanning only if the dir changed.
+
+        Adding, replacing or removing a debate file, in this process or
+        another, bumps the directory's mtime, so an unchanged directory costs
+        one ``stat()`` instead of a listing.  A directory modified within
+        ``_CATALOG_SETTLE_NS`` of the scan is rescanned on the next call.
+        """
+        dir_mtime = self.storage_dir.stat().st_mtime_ns
+        if self._files is None or dir_mtime != self._files_mtime:
+            self._files = self._scan_debate_files()
+            settled = time.time_ns() - dir_mtime > _CATALOG_SETTLE_NS
+            self._files_mtime = dir_mtime if settled else None
+        return self._files
+
+    def reindex(self) -> None:
+        """Drop the in-memory catalog and index so the next call rescans disk.
+
+        The directory mtime normally triggers this; use it where that is
+        unreliable, e.g. on filesystems with very coarse timestamps.
+        """
+        self._files = None
+        self._index = None
+
+    def _index_lock(self) -> FileLock:
+        """Return the FileLock sidecar serializing index updates across processes."""
+        return FileLock(str(self.storage_dir / _INDEX_FILE) + ".lock", timeout=5)
+
+    def _read_index(self) -> _TermIndex:
+        """Parse the on-disk index, or return an empty one if missing or corrupt."""
+        try:
+            return _TermIndex.from_json((self.storage_dir / _INDEX_FILE).read_text())
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return _TermIndex()
+
+    def _reconcile_index(self, index: _TermIndex, files: dict[str, int]) -> bool:
+        """Make *index* cover exactly the debates in *files*; return True if it changed.
+
+        Other processes save and prune debates too, so the persisted index is
+        checked against the debate files instead of being trusted as-is.
+        """
+        stale = index.docs.keys() - files.keys()
+        index.discard(stale)
+        missing = files.keys() - index.docs.keys()
+        for debate_id in missing:
+            try:
+                _, vec = _load_debate_cached(self.storage_dir / f"{debate_id}.json")
+            except Exception:
+                continue
+            index.add(debate_id, vec)
+        return bool(stale or missing)
+
+    def _load_index(self) -> _TermIndex:
+        """Return the topic index, reconciled with the current debate catalog.
+
+        It is reloaded from disk whenever the catalog was rescanned.
+        """
+        files = self._debate_files()
+        if self._index is not None and self._index_files is files:
+            return self._index
+
+        try:
+            with self._index_lock():
+                index = self._read_index()
+                if self._reconcile_index(index, files):
+                    self._write_index(index)
+        except Timeout:
+            logger.warning("Lock timeout reading debate index, using an unsaved copy")
+            index = self._read_index()
+            self._reconcile_index(index, files)
+        self._index = index
+        self._index_files = files
+        return index
+
+    def _write_index(self, index: _TermIndex) -> None:
+        """Persist *index*; the caller holds the index lock."""
+        try:
+            (self.storage_dir / _INDEX_FILE).write_text(index.to_json())
+        except OSError as e:
+            logger.warning(f"Failed to write debate index: {e}")
 
     def save(self, result: DebateResult) -> None:
         """Save debate to disk, enforcing disk quota."""
         debate_file = self.storage_dir / f"{result.debate_id}.json"
+        topic_tf = _tfidf_vector(result.topic)
         data = {
+            "schema_version": _DEBATE_SCHEMA_VERSION,
             "debate_id": result.debate_id,
             "topic": result.topic,
             "strategy": result.strategy.value,
@@ -102,83 +330,129 @@ class DebateMemory:
             "actions": result.actionable_items,
             "converged": result.converged,
             "timestamp": datetime.now().isoformat(),
+            "topic_tf": topic_tf,
         }
-        debate_file.write_text(json.dumps(data, indent=2))
-        self._enforce_quota()
-
-    def _enforce_quota(self) -> None:
-        """Remove oldest debate files when over quota."""
-        files = sorted(self.storage_dir.glob("*.json"), key=lambda f: f.stat().st_mtime)
-        while len(files) > _MAX_DEBATE_FILES:
-            oldest = files.pop(0)
-            oldest.unlink(missing_ok=True)
-            logger.debug(f"Pruned old debate: {oldest.name}")
+        # Serialize straight into a temp file, then swap it in atomically so
+        # readers never see a half-written debate.
+        tmp_file = debate_file.with_name(debate_file.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, debate_file)
+
+        # Merge into the index as it is on disk now, not as this instance
+        # last saw it, so overlapping saves don't drop each other's debates.
+        try:
+            with self._index_lock():
+                self.reindex()
+                files = self._debate_files()
+                self._enforce_quota(files)
+                index = self._read_index()
+                self._reconcile_index(index, files)
+                index.add(result.debate_id, topic_tf)
+                self._write_index(index)
+        except Timeout:
+            logger.error(f"Lock timeout indexing debate {result.debate_id}, deferring to next load")
+            self.reindex()
+            return
+        self._index = index
+        self._index_files = files
+
+    def _enforce_quota(self, files: dict[str, int]) -> None:
+        """Remove oldest debate files when over quota, dropping them from *files*."""
+        excess = len(files) - _MAX_DEBATE_FILES
+        if excess <= 0:
+            return
+        for oldest in heapq.nsmallest(excess, files, key=files.__getitem__):
+            try:
+                os.unlink(self.storage_dir / f"{oldest}.json")
+            except FileNotFoundError:
+                pass
+            del files[oldest]
+            logger.debug(f"Pruned old debate: {oldest}")
 
     def load(self, debate_id: str) -> DebateResult | None:
         """Load debate from disk."""
         debate_file = self.storage_dir / f"{debate_id}.json"
-        if not debate_file.exists():
+        try:
+            data, _ = _load_debate_cached(debate_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to load debate {debate_id}: {e}")
             return None
 
         try:
-            data = json.loads(debate_file.read_text())
             return DebateResult(
                 debate_id=data["debate_id"],
                 topic=data["topic"],
                 strategy=DebateStrategy(data["strategy"]),
                 rounds_completed=data["rounds_completed"],
                 final_synthesis=data.get("synthesis", ""),
-                consensus_points=data.get("consensus", []),
-                disagreement_points=data.get("disagreements", []),
-                actionable_items=data.get("actions", []),
+                consensus_points=list(data.get("consensus", [])),
+                disagreement_points=list(data.get("disagreements", [])),
+                actionable_items=list(data.get("actions", [])),
                 converged=data.get("converged", False),
             )
         except Exception as e:
             logger.error(f"Failed to load debate {debate_id}: {e}")
             return None
 
-    def get_all_debates(self, limit: int = 20) -> list[dict]:
-        """Get all debates."""
-        debates = []
-        for debate_file in sorted(
-            self.storage_dir.glob("*.json"),
-            key=lambda f: f.stat().st_mtime,
-            reverse=True,
-        )[:limit]:
+    def _iter_cached_debates(self, limit: int) -> Iterator[dict[str, Any]]:
+        """Yield the newest *limit* parsed debates, shared with the file cache.
+
+        Callers must treat them as read-only.
+        """
+        files = self._debate_files()
+        for debate_id in heapq.nlargest(limit, files, key=files.__getitem__):
             try:
-                data = json.loads(debate_file.read_text())
-                debates.append(data)
+                data, _ = _load_debate_cached(self.storage_dir / f"{debate_id}.json")
             except Exception:
-                pass
-        return debates
+                continue
+            yield data
+
+    def get_all_debates(self, limit: int = 20) -> list[dict]:
+        """Get all debates.
+
+        Each entry is a deep copy, so callers can't mutate the parsed-file cache.
+        """
+        return [
+            {k: copy.deepcopy(v) for k, v in data.items() if k not in _DERIVED_FIELDS}
+            for data in self._iter_cached_debates(limit)
+        ]
 
     def find_related_debates(self, topic: str, limit: int = 5) -> list[RelatedDebate]:
-        """Find debates related to a topic using TF-IDF cosine similarity."""
-        related = []
-        topic_tfidf = _tfidf_vector(topic)
+        """Find debates related to a topic using TF-IDF cosine similarity.
+
+        Terms are IDF-weighted against the stored topics, so rare, specific
+        words dominate the match.  Scores come straight from the inverted
+        index (a sparse matrix-vector product over the query's tokens); only
+        the debates that make the cut are opened to fill in their details.
+        """
+        scores = self._load_index().cosine_scores(_tfidf_vector(topic))
 
-        for debate_file in self.storage_dir.glob("*.json"):
+        related: list[RelatedDebate] = []
+        ranked = heapq.nlargest(
+            limit, ((score, stem) for stem, score in scores.items() if score > 0.1)
+        )
+        for score, stem in ranked:
             try:
-                data = json.loads(debate_file.read_text())
-                debate_tfidf = _tfidf_vector(data["topic"])
-                score = _cosine_similarity(topic_tfidf, debate_tfidf)
-                if score > 0.1:
-                    related.append(
-                        RelatedDebate(
-                            debate_id=data["debate_id"],
-                            topic=data["topic"],
-                            relevance_score=score,
-                            key_insights=data.get("consensus", [])[:3],
-                        )
+                data, _ = _load_debate_cached(self.storage_dir / f"{stem}.json")
+                related.append(
+                    RelatedDebate(
+                        debate_id=data["debate_id"],
+                        topic=data["topic"],
+                        relevance_score=score,
+                        key_insights=data.get("consensus", [])[:3],
                     )
+                )
             except Exception:
                 pass
-
-        return sorted(related, key=lambda r: r.relevance_score, reverse=True)[:limit]
+        return related
 
     def get_statistics(self) -> dict:
         """Get debate statistics."""
-        debates = self.get_all_debates(limit=1000)
+        # Only counted, never handed out, so read the cached dicts uncopied.
+        debates = list(self._iter_cached_debates(limit=1000))
         total = len(debates)
         converged = sum(1 for d in debates if d.get("converged", False))
         insights = sum(len(d.get("consensus", [])) for d in debates)
@@ -215,79 +489,81 @@ class DebateMemory:
 # ---------------------------------------------------------------------------
 
 
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "being",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "could",
+        "should",
+        "may",
+        "might",
+        "shall",
+        "can",
+        "to",
+        "of",
+        "in",
+        "for",
+        "on",
+        "with",
+        "at",
+        "by",
+        "from",
+        "as",
+        "into",
+        "through",
+        "and",
+        "but",
+        "or",
+        "nor",
+        "not",
+        "so",
+        "yet",
+        "both",
+        "either",
+        "neither",
+        "it",
+        "its",
+        "this",
+        "that",
+        "these",
+        "those",
+        "i",
+        "you",
+        "he",
+        "she",
+        "we",
+        "they",
+        "me",
+        "him",
+        "her",
+        "us",
+        "them",
+        "my",
+        "your",
+    }
+)
+
+
 def _tokenize(text: str) -> list[str]:
     """Simple whitespace + lowercase tokenizer with stopword removal."""
-    stopwords = frozenset(
-        {
-            "the",
-            "a",
-            "an",
-            "is",
-            "are",
-            "was",
-            "were",
-            "be",
-            "been",
-            "being",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "could",
-            "should",
-            "may",
-            "might",
-            "shall",
-            "can",
-            "to",
-            "of",
-            "in",
-            "for",
-            "on",
-            "with",
-            "at",
-            "by",
-            "from",
-            "as",
-            "into",
-            "through",
-            "and",
-            "but",
-            "or",
-            "nor",
-            "not",
-            "so",
-            "yet",
-            "both",
-            "either",
-            "neither",
-            "it",
-            "its",
-            "this",
-            "that",
-            "these",
-            "those",
-            "i",
-            "you",
-            "he",
-            "she",
-            "we",
-            "they",
-            "me",
-            "him",
-            "her",
-            "us",
-            "them",
-            "my",
-            "your",
-        }
-    )
-    words = re.findall(r"[a-z0-9]+", text.lower())
-    return [w for w in words if w not in stopwords and len(w) > 1]
+    return [w for w in _TOKEN_RE.findall(text.lower()) if len(w) > 1 and w not in _STOPWORDS]
 
 
 def _tfidf_vector(text: str) -> dict[str, float]:
@@ -300,19 +576,78 @@ def _tfidf_vector(text: str) -> dict[str, float]:
     return {word: count / total for word, count in counts.items()}
 
 
-def _cosine_similarity(a: dict[str, float], b: dict[str, float]) -> float:
+def _vector_norm(vec: Mapping[str, float]) -> float:
+    """L2 norm of a sparse vector."""
+    return math.sqrt(sum(v * v for v in vec.values()))
+
+
+def _cosine_similarity(a: Mapping[str, float], b: Mapping[str, float]) -> float:
     """Cosine similarity between two sparse TF vectors."""
-    if not a or not b:
-        return 0.0
-    common = set(a) & set(b)
-    if not common:
+    if len(a) > len(b):
+        a, b = b, a
+    dot = 0.0
+    for k, va in a.items():
+        vb = b.get(k)
+        if vb is not None:
+            dot += va * vb
+    if dot == 0.0:
         return 0.0
-    dot = sum(a[k] * b[k] for k in common)
-    mag_a = math.sqrt(sum(v * v for v in a.values()))
-    mag_b = math.sqrt(sum(v * v for v in b.values()))
-    if mag_a == 0 or mag_b == 0:
-        return 0.0
-    return dot / (mag_a * mag_b)
+    return dot / (_vector_norm(a) * _vector_norm(b))
+
+
+@dataclass
+class _NoveltyWindow:
+    """Running term counts over the most recent debate rounds.
+
+    Each round is tokenized once; its counts are added to the window and
+    subtracted again when the round falls out of it. Cosine similarity is
+    scale invariant, so raw counts score the same as normalized TF vectors.
+    """
+
+    size: int = 2
+    rounds: deque[Counter[str]] = field(default_factory=deque)
+    counts: Counter[str] = field(default_factory=Counter)
+
+    def observe(self, response_a: str, response_b: str) -> float:
+        """Score a round's novelty against the window, then slide it forward.
+
+        High similarity (>0.8) → low novelty → convergence. The first round
+        is always fully novel.
+        """
+        current = Counter(_tokenize(response_a + " " + response_b))
+        if self.rounds:
+            similarity = _cosine_similarity(current, self.counts)
+            novelty = max(0.0, min(1.0, 1.0 - similarity))
+        else:
+            novelty = 1.0
+
+        if len(self.rounds) == self.size:
+            self.counts -= self.rounds.popleft()
+        self.rounds.append(current)
+        self.counts.update(current)
+        return novelty
+
+
+# JSON extraction: structural characters outside strings, and the remainder
+# of a string body (escape-aware) up to and including its closing quote.
+_JSON_STRUCTURAL_RE = re.compile(r'[{}"]')
+_JSON_STRING_TAIL_RE = re.compile(r'(?:[^"\\]++|\\.)*+"', re.DOTALL)
+
+
+# Shared DebateMemory per storage directory, so its catalog and index outlive
+# a single tool call (thread-safe via a lock).
+_memories: dict[Path, DebateMemory] = {}
+_memories_lock = threading.Lock()
+
+
+def get_debate_memory() -> DebateMemory:
+    """Get or create the shared DebateMemory for the configured storage dir."""
+    storage_dir = config.debate_storage_dir
+    with _memories_lock:
+        memory = _memories.get(storage_dir)
+        if memory is None:
+            memory = _memories[storage_dir] = DebateMemory()
+    return memory
 
 
 class DebateOrchestrator:
@@ -323,7 +658,7 @@ class DebateOrchestrator:
     """
 
     def __init__(self) -> None:
-        self.memory = DebateMemory()
+        self.memory = get_debate_memory()
         self.client = get_client()
 
     async def start_debate(
@@ -353,6 +688,7 @@ class DebateOrchestrator:
 
         # Run debate rounds
         previous_responses: list[tuple[str, str]] = []
+        novelty_window = _NoveltyWindow()
 
         for round_num in range(1, debate_cfg.max_rounds + 1):
             if progress_callback:
@@ -396,8 +732,8 @@ class DebateOrchestrator:
             )
             previous_responses.append(("Expert B", response_b))
 
-            # Calculate novelty using TF-IDF cosine similarity
-            novelty = self._calculate_novelty(response_a, response_b, rounds)
+            # Novelty: cosine distance from the last two rounds
+            novelty = novelty_window.observe(response_a, response_b)
 
             rounds.append(
                 DebateRound(
@@ -490,30 +826,6 @@ Round: {round_num}
         response = await self.client.generate(request)
         return response.text
 
-    def _calculate_novelty(
-        self, response_a: str, response_b: str, previous_rounds: list[DebateRound]
-    ) -> float:
-        """Calculate novelty via TF-IDF cosine similarity.
-
-        Compares the current round's content against previous rounds.
-        High similarity (>0.8) → low novelty → convergence.
-        """
-        if not previous_rounds:
-            return 1.0
-
-        # Build TF vectors for current round and previous rounds
-        current_text = response_a + " " + response_b
-        current_vec = _tfidf_vector(current_text)
-
-        prev_text = " ".join(
-            r.expert_a_response + " " + r.expert_b_response for r in previous_rounds[-2:]
-        )
-        prev_vec = _tfidf_vector(prev_text)
-
-        similarity = _cosine_similarity(current_vec, prev_vec)
-        # Novelty = 1 - similarity (high similarity = low novelty = convergence)
-        return max(0.0, min(1.0, 1.0 - similarity))
-
     async def _generate_synthesis(self, topic: str, rounds: list[DebateRound]) -> dict:
         """Generate final synthesis of the debate."""
         rounds_summary = "\n".join(
@@ -580,31 +892,29 @@ Respond with ONLY a JSON object (no markdown fences):
             return None
 
         depth = 0
-        in_string = False
-        escape = False
         # Bound scan to prevent CPU exhaustion on malformed input
         max_scan = min(len(text), start + 100_000)
+        pos = start
 
-        for i in range(start, max_scan):
-            c = text[i]
-            if escape:
-                escape = False
-                continue
-            if c == "\\":
-                escape = True
-                continue
+        # Jump between braces and quotes; string bodies are skipped in one
+        # regex match, so uninteresting characters never reach Python code.
+        while (m := _JSON_STRUCTURAL_RE.search(text, pos, max_scan)) is not None:
+            i = m.start()
+            c = m.group()
             if c == '"':
-                in_string = not in_string
-                continue
-            if in_string:
+                tail = _JSON_STRING_TAIL_RE.match(text, i + 1, max_scan)
+                if tail is None:
+                    return None
+                pos = tail.end()
                 continue
             if c == "{":
                 depth += 1
-            elif c == "}":
+            else:
                 depth -= 1
                 if depth == 0:
                     try:
                         return json.loads(text[start : i + 1])
                     except json.JSONDecodeError:
                         return None
+            pos = i + 1
         return None
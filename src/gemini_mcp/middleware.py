@@ -9,11 +9,19 @@ instead of Starlette's ``BaseHTTPMiddleware``, which is known to:
 Ref: https://github.com/encode/starlette/discussions/1729
 """
 
+import asyncio
+import atexit
 import hmac
-import json
 import logging
+import sys
 import time
-from typing import Any
+from collections import OrderedDict, deque
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from functools import partial
+from typing import Any, BinaryIO
+
+import orjson
 
 from .config import config
 
@@ -26,36 +34,91 @@ logger = logging.getLogger(__name__)
 _audit_logger = logging.getLogger("gemini_mcp.audit")
 
 
+# Direct JSON-lines sink; None routes events through ``_audit_logger``
+_audit_stream: BinaryIO | None = None
+# Lines written to the direct sink are batched: events raised on the event
+# loop are buffered and written together shortly after.  The buffer is
+# bounded; under sustained overload the oldest lines are dropped (counted).
+_AUDIT_BUFFER_MAX = 10_000
+_AUDIT_FLUSH_DELAY = 0.01
+_audit_pending: deque[bytes] = deque(maxlen=_AUDIT_BUFFER_MAX)
+_audit_flush_loop: asyncio.AbstractEventLoop | None = None  # loop with a flush pending
+_audit_dropped = 0
+# Aware datetimes are encoded by orjson itself (ISO-8601, "+00:00" offset)
+_AUDIT_DUMPS_OPTS = orjson.OPT_APPEND_NEWLINE
+
+
 def _setup_audit_logger() -> None:
-    """Configure the audit logger with JSON formatting to stdout."""
-    if _audit_logger.handlers:
-        return  # Already configured
+    """Send audit events to stdout as JSON lines, bypassing ``logging``.
 
-    import sys
+    If an embedding application already attached handlers to the
+    ``gemini_mcp.audit`` logger, events keep flowing through it instead.
+    Unless a level was set on it, the logger is opened to INFO so events
+    aren't filtered by the root logger's WARNING default.
+    """
+    global _audit_stream
+    if _audit_logger.level == logging.NOTSET:
+        _audit_logger.setLevel(logging.INFO)
+    if _audit_logger.handlers:
+        return  # Configured externally
 
-    class _JSONFormatter(logging.Formatter):
-        def format(self, record: logging.LogRecord) -> str:
-            from datetime import UTC, datetime
+    _audit_stream = sys.stdout.buffer
+    atexit.register(_flush_audit)
 
-            entry: dict = {
-                "timestamp": datetime.now(UTC).isoformat(),
-                "level": record.levelname,
-                "event": record.getMessage(),
-            }
-            if hasattr(record, "audit_data"):
-                entry.update(record.audit_data)
-            return json.dumps(entry)
 
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(_JSONFormatter())
-    _audit_logger.addHandler(handler)
-    _audit_logger.setLevel(logging.INFO)
-    _audit_logger.propagate = False
+def _flush_audit() -> None:
+    """Write all buffered audit lines to the direct sink in one call."""
+    global _audit_flush_loop, _audit_dropped
+    _audit_flush_loop = None
+    if _audit_dropped:
+        logger.warning(f"Dropped {_audit_dropped} audit events (buffer full)")
+        _audit_dropped = 0
+    if not _audit_pending or _audit_stream is None:
+        return
+    blob = b"".join(_audit_pending)
+    _audit_pending.clear()
+    _audit_stream.write(blob)
+    _audit_stream.flush()
+
+
+def _buffer_audit_line(line: bytes) -> None:
+    """Queue a line for the next batched write (immediate off the event loop)."""
+    global _audit_flush_loop, _audit_dropped
+    if len(_audit_pending) == _AUDIT_BUFFER_MAX:
+        _audit_dropped += 1
+    _audit_pending.append(line)
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _flush_audit()
+        return
+    # A flush left pending on a loop that has since stopped is rescheduled here
+    if _audit_flush_loop is not loop:
+        loop.call_later(_AUDIT_FLUSH_DELAY, _flush_audit)
+        _audit_flush_loop = loop
 
 
 def audit_event(event: str, **fields: str) -> None:
-    """Log a structured audit event (no-op if audit_log is disabled)."""
-    if not config.audit_log:
+    """Log a structured audit event (no-op if audit_log is disabled).
+
+    ``audit_log`` is read once at import; toggling it requires a restart.
+    """
+    if not _AUDIT_ENABLED:
+        return
+    if _audit_stream is not None:
+        _buffer_audit_line(
+            orjson.dumps(
+                {
+                    "timestamp": datetime.now(UTC),
+                    "level": "INFO",
+                    "event": event,
+                    **fields,
+                },
+                option=_AUDIT_DUMPS_OPTS,
+            )
+        )
+        return
+    if not _audit_logger.isEnabledFor(logging.INFO):
         return
     record = _audit_logger.makeRecord(_audit_logger.name, logging.INFO, "", 0, event, (), None)
     record.audit_data = fields  # type: ignore[attr-defined]
@@ -63,42 +126,67 @@ def audit_event(event: str, **fields: str) -> None:
 
 
 # Initialize audit logger if enabled
-if config.audit_log:
+_AUDIT_ENABLED = bool(config.audit_log)
+if _AUDIT_ENABLED:
     _setup_audit_logger()
 
 
 # ---------------------------------------------------------------------------
-# ASGI JSON response helper
+# ASGI JSON response helpers
 # ---------------------------------------------------------------------------
-async def _send_json(
-    send: Any,
-    status_code: int,
-    body: dict,
-    extra_headers: list[tuple[bytes, bytes]] | None = None,
-) -> None:
-    """Send a JSON response via raw ASGI protocol."""
-    content = json.dumps(body).encode()
-    headers: list[tuple[bytes, bytes]] = [
+def _json_headers(content: bytes, *extra: tuple[bytes, bytes]) -> tuple[tuple[bytes, bytes], ...]:
+    """Build the full header set for a JSON body of known content."""
+    return (
         (b"content-type", b"application/json"),
         (b"content-length", str(len(content)).encode()),
-    ]
-    if extra_headers:
-        headers.extend(extra_headers)
-    await send(
-        {
-            "type": "http.response.start",
-            "status": status_code,
-            "headers": headers,
-        }
-    )
-    await send(
-        {
-            "type": "http.response.body",
-            "body": content,
-        }
+        *extra,
     )
 
 
+async def _send_precomputed(
+    send: Any,
+    status_code: int,
+    content: bytes,
+    headers: Sequence[tuple[bytes, bytes]],
+) -> None:
+    """Send a response whose body and complete headers are already built.
+
+    Both messages are built before the first await so the two sends run
+    back to back.
+    """
+    start = {"type": "http.response.start", "status": status_code, "headers": headers}
+    body = {"type": "http.response.body", "body": content}
+    await send(start)
+    await send(body)
+
+
+# Endpoints that bypass auth and rate limiting (container health probes)
+_EXEMPT_PATHS: frozenset[str] = frozenset({"/health"})
+
+# Fixed rejection responses, encoded once at import
+_UNAUTHORIZED_BODY = orjson.dumps({"error": "unauthorized"})
+_UNAUTHORIZED_HEADERS = _json_headers(_UNAUTHORIZED_BODY, (b"www-authenticate", b"Bearer"))
+
+
+# ---------------------------------------------------------------------------
+# Request header lookup shared across the middleware stack
+# ---------------------------------------------------------------------------
+_HEADER_MAP_KEY = "gemini_mcp.header_map"
+
+
+def _header_map(scope: dict) -> dict[bytes, bytes]:
+    """Return the request headers as a dict, building it once per request.
+
+    The map is memoized on the ASGI scope, which every middleware in the
+    stack shares, so the raw header list is walked a single time.  When a
+    header repeats, the first occurrence wins, matching a forward scan.
+    """
+    headers = scope.get(_HEADER_MAP_KEY)
+    if headers is None:
+        headers = scope[_HEADER_MAP_KEY] = dict(reversed(scope.get("headers", ())))
+    return headers
+
+
 # ---------------------------------------------------------------------------
 # Bearer Token Auth Middleware (pure ASGI)
 # ---------------------------------------------------------------------------
@@ -107,43 +195,36 @@ class BearerAuthMiddleware:
 
     - Uses ``hmac.compare_digest`` for constant-time token comparison
     - Case-insensitive "Bearer" prefix per RFC 7235
-    - ``/health`` endpoint exempt for Docker probes
+    - ``_EXEMPT_PATHS`` (``/health``) exempt for Docker probes
     """
 
     def __init__(self, app: Any, token: str = "") -> None:
         self.app = app
         self.token = token
+        self._token_bytes = token.encode()
+        if not token:
+            logger.warning("Bearer auth enabled with an empty token; all requests will be rejected")
 
     async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
         if scope["type"] != "http":
             await self.app(scope, receive, send)
             return
 
-        path = scope.get("path", "")
-        if path == "/health":
+        if scope.get("path", "") in _EXEMPT_PATHS:
             await self.app(scope, receive, send)
             return
 
-        # Extract Authorization header (ASGI headers are bytes)
-        auth_header = ""
-        for key, value in scope.get("headers", []):
-            if key == b"authorization":
-                auth_header = value.decode("latin-1")
-                break
+        # Authorization header, compared as raw bytes (no decode)
+        auth_header = _header_map(scope).get(b"authorization", b"")
 
-        # Case-insensitive "Bearer " prefix per RFC 7235
+        # Case-insensitive "Bearer " prefix per RFC 7235.  An empty configured
+        # token fails closed without reaching compare_digest.
         valid = False
-        if len(auth_header) > 7 and auth_header[:7].lower() == "bearer ":
-            provided_token = auth_header[7:]
-            valid = hmac.compare_digest(provided_token, self.token)
+        if self._token_bytes and len(auth_header) > 7 and auth_header[:7].lower() == b"bearer ":
+            valid = hmac.compare_digest(auth_header[7:], self._token_bytes)
 
         if not valid:
-            await _send_json(
-                send,
-                401,
-                {"error": "unauthorized"},
-                [(b"www-authenticate", b"Bearer")],
-            )
+            await _send_precomputed(send, 401, _UNAUTHORIZED_BODY, _UNAUTHORIZED_HEADERS)
             return
 
         await self.app(scope, receive, send)
@@ -153,17 +234,44 @@ class BearerAuthMiddleware:
 # Token Bucket Rate Limiter — in-memory with LRU eviction (pure ASGI)
 # ---------------------------------------------------------------------------
 class _TokenBucket:
-    """Per-client token bucket for rate limiting."""
+    """Per-client token bucket for rate limiting.
+
+    Balances are integer nanoseconds of refill time ("nano-tokens"): one
+    request costs ``60e9 / rate`` and a bucket gains one per elapsed
+    nanosecond, so the hot path is pure integer arithmetic on
+    ``time.monotonic_ns()``.
+    """
 
-    __slots__ = ("tokens", "last_refill")
+    __slots__ = ("ns_tokens", "last_refill_ns")
 
-    def __init__(self, capacity: float) -> None:
-        self.tokens = capacity
-        self.last_refill = time.monotonic()
+    def __init__(self, capacity_ns: int) -> None:
+        self.ns_tokens = capacity_ns
+        self.last_refill_ns = time.monotonic_ns()
 
 
 # Maximum tracked client IPs to prevent memory exhaustion from rotating-IP DDoS.
 _MAX_RATE_LIMIT_BUCKETS = 10_000
+# Buckets are split across this many LRU shards (a power of two), each
+# holding an equal share of the cap.
+_RATE_LIMIT_SHARDS = 16
+# Buckets untouched for this long are dropped when new clients arrive.
+_IDLE_BUCKET_NS = 300 * 1_000_000_000
+# Rejections are the hot path under a flood: their body is encoded once.
+_RATE_LIMITED_BODY = orjson.dumps({"error": "Rate limit exceeded"})
+
+
+async def _send_with_headers(
+    send: Any, extra: tuple[tuple[bytes, bytes], ...], message: dict
+) -> None:
+    """Append ``extra`` headers to the response start message, then send.
+
+    The start message is a fresh dict per response, so it is extended in
+    place.  Bound per request with ``functools.partial`` rather than a
+    closure.
+    """
+    if message["type"] == "http.response.start":
+        message["headers"] = [*message.get("headers", ()), *extra]
+    await send(message)
 
 
 class RateLimitMiddleware:
@@ -172,87 +280,111 @@ class RateLimitMiddleware:
     Configured via:
       GEMINI_MCP_RATE_LIMIT — requests per minute (0 = disabled)
       GEMINI_MCP_RATE_LIMIT_BURST — max burst capacity
-
-    Evicts the oldest (least-recently-refilled) bucket when the bucket count
-    exceeds ``_MAX_RATE_LIMIT_BUCKETS``, preventing unbounded memory growth
-    from rotating-IP attacks.
+      GEMINI_MCP_RATE_LIMIT_HEADERS — add X-RateLimit-* to allowed responses
+
+    Buckets are hashed by client IP into ``_RATE_LIMIT_SHARDS`` shards, each
+    kept in least-recently-used order.  When a new client arrives, buckets
+    in its shard idle for ``_IDLE_BUCKET_NS`` that have refilled to full (so
+    dropping them changes nothing) are swept from the cold end, and the
+    shard's oldest bucket is evicted beyond its share of
+    ``_MAX_RATE_LIMIT_BUCKETS`` — bounding memory under rotating-IP attacks
+    with O(1) work per request on small, cache-friendly tables.
     """
 
-    def __init__(self, app: Any, rate: int = 0, burst: int = 20) -> None:
+    def __init__(self, app: Any, rate: int = 0, burst: int = 20, headers: bool = True) -> None:
         self.app = app
         self.rate = rate
         self.burst = burst
-        self.tokens_per_second = rate / 60.0
-        self._buckets: dict[str, _TokenBucket] = {}
+        self.inject_headers = headers
+        # Cost of one request, and bucket capacity, in nanoseconds of refill
+        self.ns_per_token = 60_000_000_000 // rate if rate > 0 else 0
+        self.capacity_ns = burst * self.ns_per_token
+        self._limit_header = (b"x-ratelimit-limit", str(rate).encode())
+        # Remaining-count headers for every possible balance (0..burst)
+        self._remaining_headers = [
+            (b"x-ratelimit-remaining", str(i).encode()) for i in range(burst + 1)
+        ]
+        self._rate_limited_headers = _json_headers(
+            _RATE_LIMITED_BODY, self._limit_header, (b"x-ratelimit-remaining", b"0")
+        )
+        self._shards: list[OrderedDict[str, _TokenBucket]] = [
+            OrderedDict() for _ in range(_RATE_LIMIT_SHARDS)
+        ]
+        self._shard_mask = _RATE_LIMIT_SHARDS - 1
+        self._shard_cap = max(1, _MAX_RATE_LIMIT_BUCKETS // _RATE_LIMIT_SHARDS)
 
     async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
         if scope["type"] != "http" or self.rate <= 0:
             await self.app(scope, receive, send)
             return
 
-        # Health endpoint is always exempt
+        # Probe endpoints are always exempt
         path = scope.get("path", "")
-        if path == "/health":
+        if path in _EXEMPT_PATHS:
             await self.app(scope, receive, send)
             return
 
         client_ip = self._get_client_ip(scope)
         bucket = self._get_or_create_bucket(client_ip)
 
-        # Refill tokens
-        now = time.monotonic()
-        elapsed = now - bucket.last_refill
-        bucket.tokens = min(float(self.burst), bucket.tokens + elapsed * self.tokens_per_second)
-        bucket.last_refill = now
+        # Refill tokens (inline clamp: cheaper than a min() call)
+        now = time.monotonic_ns()
+        ns_tokens = bucket.ns_tokens + (now - bucket.last_refill_ns)
+        if ns_tokens > self.capacity_ns:
+            ns_tokens = self.capacity_ns
+        bucket.ns_tokens = ns_tokens
+        bucket.last_refill_ns = now
 
-        if bucket.tokens < 1.0:
-            retry_after = int((1.0 - bucket.tokens) / self.tokens_per_second) + 1
+        if bucket.ns_tokens < self.ns_per_token:
+            retry_after = (self.ns_per_token - bucket.ns_tokens) // 1_000_000_000 + 1
             audit_event("rate_limited", client_ip=client_ip, path=path)
-            await _send_json(
+            await _send_precomputed(
                 send,
                 429,
-                {"error": "Rate limit exceeded"},
-                [
-                    (b"retry-after", str(retry_after).encode()),
-                    (b"x-ratelimit-limit", str(self.rate).encode()),
-                    (b"x-ratelimit-remaining", b"0"),
-                ],
+                _RATE_LIMITED_BODY,
+                (*self._rate_limited_headers, (b"retry-after", str(retry_after).encode())),
             )
             return
 
-        bucket.tokens -= 1.0
-        remaining = str(int(bucket.tokens))
-
-        # Inject rate-limit headers into the response
-        async def send_with_headers(message: dict) -> None:
-            if message["type"] == "http.response.start":
-                headers = list(message.get("headers", []))
-                headers.append((b"x-ratelimit-limit", str(self.rate).encode()))
-                headers.append((b"x-ratelimit-remaining", remaining.encode()))
-                message = {**message, "headers": headers}
-            await send(message)
+        bucket.ns_tokens -= self.ns_per_token
+        if not self.inject_headers:
+            await self.app(scope, receive, send)
+            return
 
-        await self.app(scope, receive, send_with_headers)
+        remaining = self._remaining_headers[bucket.ns_tokens // self.ns_per_token]
+        await self.app(
+            scope, receive, partial(_send_with_headers, send, (self._limit_header, remaining))
+        )
 
     def _get_or_create_bucket(self, client_ip: str) -> _TokenBucket:
-        """Get existing bucket or create new one with LRU eviction."""
-        if client_ip in self._buckets:
-            return self._buckets[client_ip]
-
-        # Evict oldest (least-recently-refilled) entry if at capacity
-        if len(self._buckets) >= _MAX_RATE_LIMIT_BUCKETS:
-            oldest_key = min(self._buckets, key=lambda k: self._buckets[k].last_refill)
-            del self._buckets[oldest_key]
+        """Get existing bucket or create new one with per-shard LRU eviction."""
+        buckets = self._shards[hash(client_ip) & self._shard_mask]
+        bucket = buckets.get(client_ip)
+        if bucket is not None:
+            buckets.move_to_end(client_ip)
+            return bucket
+
+        # Sweep idle, fully-refilled buckets from the cold end (a fresh bucket
+        # would behave identically), then enforce the shard's cap.
+        now = time.monotonic_ns()
+        while buckets:
+            oldest = next(iter(buckets.values()))
+            idle = now - oldest.last_refill_ns
+            if idle < _IDLE_BUCKET_NS or oldest.ns_tokens + idle < self.capacity_ns:
+                break
+            buckets.popitem(last=False)
+        if len(buckets) >= self._shard_cap:
+            buckets.popitem(last=False)
 
-        self._buckets[client_ip] = _TokenBucket(float(self.burst))
-        return self._buckets[client_ip]
+        bucket = buckets[client_ip] = _TokenBucket(self.capacity_ns)
+        return bucket
 
     @staticmethod
     def _get_client_ip(scope: dict) -> str:
         """Extract client IP from ASGI scope headers."""
-        for key, value in scope.get("headers", []):
-            if key == b"x-forwarded-for":
-                return value.decode("latin-1").split(",")[0].strip()
+        forwarded = _header_map(scope).get(b"x-forwarded-for")
+        if forwarded is not None:
+            return forwarded.decode("latin-1").split(",")[0].strip()
         client = scope.get("client")
         if client:
             return client[0]
@@ -266,11 +398,40 @@ class _RequestTooLargeError(Exception):
     """Raised internally when request body exceeds size limit."""
 
 
+class _BodyState:
+    """Per-request bookkeeping for a streamed (unframed) request body."""
+
+    __slots__ = ("max_size", "body_size", "response_started")
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.body_size = 0
+        self.response_started = False
+
+
+async def _size_checked_receive(state: _BodyState, receive: Any) -> dict:
+    """Receive a message, raising once the body exceeds ``state.max_size``."""
+    message = await receive()
+    if message.get("type") == "http.request":
+        state.body_size += len(message.get("body", b""))
+        if state.body_size > state.max_size:
+            raise _RequestTooLargeError()
+    return message
+
+
+async def _tracked_send(state: _BodyState, send: Any, message: dict) -> None:
+    """Send a message, noting whether the response has started."""
+    if message["type"] == "http.response.start":
+        state.response_started = True
+    await send(message)
+
+
 class RequestSizeLimitMiddleware:
     """Pure ASGI middleware to reject oversized request bodies.
 
-    Checks both ``Content-Length`` header (fast reject) and actual streamed
-    body size (handles chunked transfer encoding).
+    Checks the ``Content-Length`` header (fast reject or pass-through) and,
+    when it is absent or a ``Transfer-Encoding`` is also sent, the actual
+    streamed body size (chunked transfer encoding).
 
     Configured via GEMINI_MCP_MAX_REQUEST_SIZE (bytes, 0 = unlimited).
     """
@@ -278,52 +439,49 @@ class RequestSizeLimitMiddleware:
     def __init__(self, app: Any, max_size: int = 0) -> None:
         self.app = app
         self.max_size = max_size
+        # Content-Length is compared as ASCII digits: a longer number is
+        # larger, and equal-length numbers order like their bytes.
+        self._max_digits = str(max_size).encode()
+        self._too_large_body = orjson.dumps(
+            {"error": f"Request body too large. Maximum: {max_size:,} bytes"}
+        )
+        self._too_large_headers = _json_headers(self._too_large_body)
 
     async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
         if scope["type"] != "http" or self.max_size <= 0:
             await self.app(scope, receive, send)
             return
 
-        # Quick reject via Content-Length header
-        for key, value in scope.get("headers", []):
-            if key == b"content-length":
-                try:
-                    if int(value) > self.max_size:
-                        await _send_json(
-                            send,
-                            413,
-                            {"error": f"Request body too large. Maximum: {self.max_size:,} bytes"},
-                        )
-                        return
-                except ValueError:
-                    pass
-                break
+        # Quick reject via Content-Length header.  Without a Transfer-Encoding,
+        # a valid in-limit length is also a guarantee: the HTTP server frames
+        # the body to exactly that many bytes, so the request passes straight
+        # through unwrapped.  With one, the server frames by Transfer-Encoding
+        # and ignores Content-Length, so the stream is still checked.
+        headers = _header_map(scope)
+        declared = headers.get(b"content-length")
+        if declared is not None and declared.isdigit():
+            if self._exceeds_limit(declared):
+                await _send_precomputed(send, 413, self._too_large_body, self._too_large_headers)
+                return
+            if b"transfer-encoding" not in headers:
+                await self.app(scope, receive, send)
+                return
 
         # Wrap receive to enforce limit on streamed/chunked bodies
-        body_size = 0
-        response_started = False
-
-        async def size_checked_receive() -> dict:
-            nonlocal body_size
-            message = await receive()
-            if message.get("type") == "http.request":
-                body_size += len(message.get("body", b""))
-                if body_size > self.max_size:
-                    raise _RequestTooLargeError()
-            return message
-
-        async def tracked_send(message: dict) -> None:
-            nonlocal response_started
-            if message["type"] == "http.response.start":
-                response_started = True
-            await send(message)
-
+        state = _BodyState(self.max_size)
         try:
-            await self.app(scope, size_checked_receive, tracked_send)
+            await self.app(
+                scope,
+                partial(_size_checked_receive, state, receive),
+                partial(_tracked_send, state, send),
+            )
         except _RequestTooLargeError:
-            if not response_started:
-                await _send_json(
-                    send,
-                    413,
-                    {"error": f"Request body too large. Maximum: {self.max_size:,} bytes"},
-                )
+            if not state.response_started:
+                await _send_precomputed(send, 413, self._too_large_body, self._too_large_headers)
+
+    def _exceeds_limit(self, digits: bytes) -> bool:
+        """Whether an ASCII-digit Content-Length is above ``max_size``."""
+        digits = digits.lstrip(b"0")
+        if len(digits) != len(self._max_digits):
+            return len(digits) > len(self._max_digits)
+        return digits > self._max_digits
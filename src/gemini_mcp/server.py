@@ -243,21 +243,23 @@ if config.enable_debate:
 def _verify_plugin_hash(plugin_file: Path) -> bool:
     """Return True if the plugin passes SHA-256 integrity check.
 
-    If hash verification is not enabled (GEMINI_MCP_PLUGIN_REQUIRE_HASH != true),
+    If hash verification is not enabled (``config.plugin_require_hash``),
     this always returns True.  When enabled, the plugin must have a matching
     .sha256 sidecar file.
     """
 
-    if os.getenv("GEMINI_MCP_PLUGIN_REQUIRE_HASH", "").lower() != "true":
+    if not config.plugin_require_hash:
         return True
 
-    hash_file = plugin_file.with_suffix(plugin_file.suffix + ".sha256")
-    if not hash_file.exists():
+    hash_file = plugin_file.with_name(plugin_file.name + ".sha256")
+    try:
+        expected = hash_file.read_text().strip().split()[0].lower()
+    except FileNotFoundError:
         logger.warning(f"Plugin hash file missing: {hash_file}")
         return False
 
-    expected = hash_file.read_text().strip().split()[0].lower()
-    actual = hashlib.sha256(plugin_file.read_bytes()).hexdigest()
+    with open(plugin_file, "rb") as f:
+        actual = hashlib.file_digest(f, "sha256").hexdigest()
     if actual != expected:
         logger.error(
             f"Plugin hash mismatch for {plugin_file.name}: "
@@ -274,27 +276,28 @@ def load_plugins() -> None:
     plugin_dir = os.getenv("PLUGIN_DIR", str(config.data_dir / "plugins"))
     plugin_path = Path(plugin_dir)
 
-    if not plugin_path.exists():
+    # One directory pass; DirEntry.is_file() reuses the type from the listing
+    try:
+        with os.scandir(plugin_path) as entries:
+            plugin_names = sorted(
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".py") and not entry.name.startswith("_") and entry.is_file()
+            )
+    except FileNotFoundError:
         logger.debug(f"Plugin directory not found: {plugin_path}")
         return
 
     # Optional allowlist — when set, only listed filenames are loaded.
-    raw_allowlist = os.getenv("GEMINI_MCP_PLUGIN_ALLOWLIST", "").strip()
-    allowlist: set[str] | None = (
-        {n.strip() for n in raw_allowlist.split(",") if n.strip()} if raw_allowlist else None
-    )
+    allowlist = config.plugin_allowlist_set
 
-    for plugin_file in sorted(plugin_path.glob("*.py")):
-        if plugin_file.name.startswith("_"):
-            continue
+    for name in plugin_names:
+        plugin_file = plugin_path / name
 
-        # --- Allowlist gate (check relative path, not just filename) ---
-        try:
-            check_name = str(plugin_file.relative_to(plugin_path))
-        except ValueError:
-            check_name = plugin_file.name
-        if allowlist is not None and check_name not in allowlist:
-            logger.debug(f"Plugin not in allowlist, skipping: {check_name}")
+        # --- Allowlist gate (plugins are direct children, so the relative
+        # path is the filename) ---
+        if allowlist is not None and name not in allowlist:
+            logger.debug(f"Plugin not in allowlist, skipping: {name}")
             continue
 
         # --- Integrity gate ---
@@ -343,6 +346,7 @@ def _run_with_auth() -> None:
                 RateLimitMiddleware,
                 rate=config.rate_limit,
                 burst=config.rate_limit_burst,
+                headers=config.rate_limit_headers,
             )
         )
         logger.info(
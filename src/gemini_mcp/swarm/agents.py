@@ -1,19 +1,48 @@
 """Agent definitions and registry for the Swarm system."""
 
+import functools
 import logging
+import os
 import re
-from dataclasses import dataclass, field
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, NamedTuple
+
+import orjson
 
 from .types import AgentType
 
 logger = logging.getLogger(__name__)
 
-# Sections we expect in persona markdown files
-_PERSONA_SECTIONS = {"role", "expertise", "capabilities", "tools", "guidelines"}
+# Sections we read from persona markdown files (lowercased heading bytes)
+_PERSONA_SECTIONS = frozenset({b"role", b"expertise", b"capabilities", b"tools", b"guidelines"})
+# Upper bound on threads used to read persona files
+_PERSONA_LOAD_WORKERS = 8
+# Parsed personas are cached as JSON in <personas_dir>/.cache/<stem>.json,
+# keyed by the source file's mtime and size; bump to invalidate old entries
+_PERSONA_CACHE_DIR = ".cache"
+_PERSONA_CACHE_VERSION = 1
+# Markdown files that may sit next to personas but are not personas (casefolded)
+_SKIP_FILES = frozenset({"readme.md", "license.md", "changelog.md", "template.md"})
+
+# Persona markdown: "# Title", "## Section" headings, "- tool" list items.
+# Headings are matched on the raw bytes; only sections we use are decoded.
+_TITLE_RE = re.compile(rb"^#\s+(.+)")
+_H2_RE = re.compile(rb"^##[^\S\n]+(.+)$", re.MULTILINE)
+_TOOL_RE = re.compile(r"-\s*(\w+)")
+
+# Custom persona keys: lowercase, with "-" and " " folded to "_"
+_NAME_NORMALIZE = str.maketrans({"-": "_", " ": "_"})
 
 
-@dataclass
+def _normalize_name(name: str) -> str:
+    """Return the registry key for a custom persona name."""
+    return name.lower().translate(_NAME_NORMALIZE)
+
+
+@dataclass(slots=True, frozen=True)
 class AgentDefinition:
     """Definition of a swarm agent."""
 
@@ -21,7 +50,7 @@ class AgentDefinition:
     name: str
     role: str
     system_prompt: str
-    tools: list[str] = field(default_factory=list)
+    tools: tuple[str, ...] = ()
     model: str | None = None  # Override default model
 
 
@@ -29,11 +58,33 @@ class AgentDefinition:
 # Agent Definitions
 # =============================================================================
 
-ARCHITECT = AgentDefinition(
-    agent_type=AgentType.ARCHITECT,
-    name="Architect",
-    role="System Design & Orchestration",
-    system_prompt="""You are a senior software architect.
+
+class _Spec(NamedTuple):
+    """Raw fields of a built-in agent, in ``AgentDefinition`` field order.
+
+    The registry holds these until an agent is first requested, so unused
+    built-ins never become ``AgentDefinition`` objects.
+    """
+
+    agent_type: AgentType
+    name: str
+    role: str
+    system_prompt: str
+    tools: tuple[str, ...]
+
+
+# Tool sets shared between definitions (tuples, so one object serves all)
+_TOOLS_ARCHITECT = ("delegate", "complete", "analyze", "search")
+_TOOLS_RESEARCHER = ("search", "analyze", "complete")
+_TOOLS_ANALYST = ("analyze", "search", "complete")
+_TOOLS_REVIEW = ("analyze", "complete")
+
+_DEFAULT_SPECS: tuple[_Spec, ...] = (
+    _Spec(
+        AgentType.ARCHITECT,
+        "Architect",
+        "System Design & Orchestration",
+        """You are a senior software architect.
 
 Your responsibilities:
 - Design system architecture
@@ -53,14 +104,13 @@ When delegating, specify:
 - agent: Which agent to use
 - task: Clear task description
 - context: Relevant information""",
-    tools=["delegate", "complete", "analyze", "search"],
-)
-
-RESEARCHER = AgentDefinition(
-    agent_type=AgentType.RESEARCHER,
-    name="Researcher",
-    role="Information Gathering",
-    system_prompt="""You are a research specialist.
+        _TOOLS_ARCHITECT,
+    ),
+    _Spec(
+        AgentType.RESEARCHER,
+        "Researcher",
+        "Information Gathering",
+        """You are a research specialist.
 
 Your responsibilities:
 - Gather information from web and documentation
@@ -73,14 +123,13 @@ Use search tools effectively:
 - search(query, depth="docs") for library documentation
 
 Always cite sources when possible.""",
-    tools=["search", "analyze", "complete"],
-)
-
-CODER = AgentDefinition(
-    agent_type=AgentType.CODER,
-    name="Coder",
-    role="Implementation",
-    system_prompt="""You are an expert software developer.
+        _TOOLS_RESEARCHER,
+    ),
+    _Spec(
+        AgentType.CODER,
+        "Coder",
+        "Implementation",
+        """You are an expert software developer.
 
 Your responsibilities:
 - Write clean, maintainable code
@@ -95,14 +144,13 @@ Code quality standards:
 - Test coverage consideration
 
 Always explain your implementation decisions.""",
-    tools=["analyze", "search", "complete"],
-)
-
-ANALYST = AgentDefinition(
-    agent_type=AgentType.ANALYST,
-    name="Analyst",
-    role="Data & Pattern Analysis",
-    system_prompt="""You are a data analyst specialist.
+        _TOOLS_ANALYST,
+    ),
+    _Spec(
+        AgentType.ANALYST,
+        "Analyst",
+        "Data & Pattern Analysis",
+        """You are a data analyst specialist.
 
 Your responsibilities:
 - Analyze patterns and trends
@@ -116,14 +164,13 @@ Use structured analysis:
 3. Identify patterns
 4. Draw conclusions
 5. Recommend actions""",
-    tools=["analyze", "search", "complete"],
-)
-
-REVIEWER = AgentDefinition(
-    agent_type=AgentType.REVIEWER,
-    name="Reviewer",
-    role="Quality Assurance",
-    system_prompt="""You are a code reviewer specialist.
+        _TOOLS_ANALYST,
+    ),
+    _Spec(
+        AgentType.REVIEWER,
+        "Reviewer",
+        "Quality Assurance",
+        """You are a code reviewer specialist.
 
 Your responsibilities:
 - Review code for quality and correctness
@@ -137,14 +184,13 @@ Review checklist:
 3. Performance - Any bottlenecks?
 4. Maintainability - Is it readable?
 5. Testing - Is it testable?""",
-    tools=["analyze", "complete"],
-)
-
-TESTER = AgentDefinition(
-    agent_type=AgentType.TESTER,
-    name="Tester",
-    role="Testing & Validation",
-    system_prompt="""You are a QA specialist.
+        _TOOLS_REVIEW,
+    ),
+    _Spec(
+        AgentType.TESTER,
+        "Tester",
+        "Testing & Validation",
+        """You are a QA specialist.
 
 Your responsibilities:
 - Design test strategies
@@ -157,14 +203,13 @@ Testing approach:
 2. Integration tests for components
 3. Edge case testing
 4. Error handling validation""",
-    tools=["analyze", "complete"],
-)
-
-DOCUMENTER = AgentDefinition(
-    agent_type=AgentType.DOCUMENTER,
-    name="Documenter",
-    role="Documentation",
-    system_prompt="""You are a technical writer.
+        _TOOLS_REVIEW,
+    ),
+    _Spec(
+        AgentType.DOCUMENTER,
+        "Documenter",
+        "Documentation",
+        """You are a technical writer.
 
 Your responsibilities:
 - Write clear documentation
@@ -177,7 +222,8 @@ Documentation standards:
 - Code examples where helpful
 - Proper formatting
 - Audience-appropriate detail""",
-    tools=["analyze", "search", "complete"],
+        _TOOLS_ANALYST,
+    ),
 )
 
 
@@ -190,59 +236,87 @@ class AgentRegistry:
     """Registry for managing agent definitions."""
 
     def __init__(self) -> None:
-        self._agents: dict[AgentType, AgentDefinition] = {}
+        self._agents: dict[AgentType, AgentDefinition | _Spec] = {}
         self._custom_agents: dict[str, AgentDefinition] = {}  # name -> definition
+        self._name_index: dict[str, AgentType] = {}  # lowercased name -> type
+        self._names_cache: tuple[str, ...] | None = None  # list_agents(), reset on register
+        self._lock = threading.Lock()  # guards registration and the names cache
         self._register_defaults()
 
     def _register_defaults(self) -> None:
-        """Register default agents."""
-        for agent in [
-            ARCHITECT,
-            RESEARCHER,
-            CODER,
-            ANALYST,
-            REVIEWER,
-            TESTER,
-            DOCUMENTER,
-        ]:
-            self._agents[agent.agent_type] = agent
+        """Register default agents (as specs, built on first use)."""
+        for spec in _DEFAULT_SPECS:
+            self._agents[spec.agent_type] = spec
+            self._name_index[spec.name.lower()] = spec.agent_type
 
     def get(self, agent_type: AgentType) -> AgentDefinition:
         """Get agent definition by type."""
-        if agent_type not in self._agents:
+        entry = self._agents.get(agent_type)
+        if entry is None:
             raise ValueError(f"Unknown agent type: {agent_type}")
-        return self._agents[agent_type]
+        if isinstance(entry, _Spec):
+            entry = self._agents[agent_type] = AgentDefinition(*entry)
+        return entry
 
     def get_by_name(self, name: str) -> AgentDefinition:
         """Get agent definition by name (checks custom personas first)."""
-        key = name.lower().replace("-", "_").replace(" ", "_")
+        key = _normalize_name(name)
         if key in self._custom_agents:
             return self._custom_agents[key]
-        for agent in self._agents.values():
-            if agent.name.lower() == name.lower():
-                return agent
+        agent_type = self._name_index.get(name.lower())
+        if agent_type is not None:
+            return self.get(agent_type)
         raise ValueError(f"Unknown agent: {name}")
 
     def has_custom(self, name: str) -> bool:
         """Check if a custom persona is registered."""
-        return name.lower().replace("-", "_").replace(" ", "_") in self._custom_agents
+        return _normalize_name(name) in self._custom_agents
+
+    def register(self, agent: AgentDefinition, replace: bool = False) -> None:
+        """Register a custom agent.
+
+        Args:
+            agent: Definition to register under ``agent.agent_type``.
+            replace: Allow overwriting an agent already registered for that
+                type. Re-registering the identical object is a no-op.
 
-    def register(self, agent: AgentDefinition) -> None:
-        """Register a custom agent."""
-        self._agents[agent.agent_type] = agent
+        Raises:
+            ValueError: If the type is taken and ``replace`` is False.
+        """
+        with self._lock:
+            replaced = self._agents.get(agent.agent_type)
+            if replaced is agent:
+                return
+            if replaced is not None:
+                if not replace:
+                    raise ValueError(
+                        f"Agent type {agent.agent_type.value} is already registered "
+                        f"as {replaced.name}; pass replace=True to override"
+                    )
+                self._name_index.pop(replaced.name.lower(), None)
+            self._agents[agent.agent_type] = agent
+            self._name_index[agent.name.lower()] = agent.agent_type
+            self._names_cache = None
         logger.info(f"Registered agent: {agent.name}")
 
     def register_custom(self, name: str, agent: AgentDefinition) -> None:
         """Register a custom persona agent by name."""
-        key = name.lower().replace("-", "_").replace(" ", "_")
-        self._custom_agents[key] = agent
+        key = _normalize_name(name)
+        with self._lock:
+            self._custom_agents[key] = agent
+            self._names_cache = None
         logger.info(f"Registered custom persona: {name}")
 
     def list_agents(self) -> list[str]:
         """List all available agent names (built-in + custom)."""
-        names = [a.name for a in self._agents.values()]
-        names.extend(a.name for a in self._custom_agents.values())
-        return names
+        names = self._names_cache
+        if names is None:
+            with self._lock:
+                names = self._names_cache = (
+                    *(a.name for a in self._agents.values()),
+                    *(a.name for a in self._custom_agents.values()),
+                )
+        return list(names)
 
     def list_custom_agents(self) -> list[str]:
         """List custom persona agent names."""
@@ -251,6 +325,11 @@ class AgentRegistry:
     def load_personas_from_dir(self, personas_dir: str | Path) -> int:
         """Load custom persona definitions from a directory of Markdown files.
 
+        Files are read and parsed on a small thread pool so their I/O
+        overlaps; registration happens afterwards, in filename order.
+        Parsed results are cached under ``.cache/`` in the same directory
+        and reused while the source file's mtime and size are unchanged.
+
         Returns the number of personas successfully loaded.
         """
         personas_path = Path(personas_dir)
@@ -258,12 +337,22 @@ class AgentRegistry:
             logger.debug(f"Personas directory not found: {personas_path}")
             return 0
 
+        md_files = [
+            md_file
+            for md_file in sorted(personas_path.glob("*.md"))
+            if md_file.name.casefold() not in _SKIP_FILES
+        ]
+        if not md_files:
+            return 0
+
+        cache_dir = personas_path / _PERSONA_CACHE_DIR
+        with ThreadPoolExecutor(max_workers=min(_PERSONA_LOAD_WORKERS, len(md_files))) as pool:
+            parsed = [pool.submit(_load_persona_file, md_file, cache_dir) for md_file in md_files]
+
         loaded = 0
-        for md_file in sorted(personas_path.glob("*.md")):
-            if md_file.name.lower() == "readme.md":
-                continue
+        for md_file, future in zip(md_files, parsed, strict=True):
             try:
-                agent = _parse_persona_file(md_file)
+                agent = future.result()
                 if agent:
                     self.register_custom(md_file.stem, agent)
                     loaded += 1
@@ -275,68 +364,120 @@ class AgentRegistry:
         return loaded
 
 
+def _load_persona_file(path: Path, cache_dir: Path) -> AgentDefinition | None:
+    """Load a persona, reusing its cached parse when the source is unchanged."""
+    st = path.stat()
+    key = [_PERSONA_CACHE_VERSION, st.st_mtime_ns, st.st_size]
+    cache_file = cache_dir / f"{path.stem}.json"
+
+    try:
+        cached = orjson.loads(cache_file.read_bytes())
+        if cached["key"] == key:
+            return _agent_from_cache(cached["agent"])
+    except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+        pass  # missing, stale or unreadable cache: parse the source
+
+    agent = _parse_persona_file(path)
+    _write_persona_cache(cache_file, key, agent)
+    return agent
+
+
+def _agent_from_cache(data: dict[str, Any] | None) -> AgentDefinition | None:
+    """Rebuild a cached persona (``None`` is cached for empty files)."""
+    if data is None:
+        return None
+    return AgentDefinition(
+        agent_type=AgentType.ANALYST,
+        name=data["name"],
+        role=data["role"],
+        system_prompt=data["system_prompt"],
+        tools=tuple(data["tools"]),
+    )
+
+
+def _write_persona_cache(cache_file: Path, key: list[int], agent: AgentDefinition | None) -> None:
+    """Write a persona cache entry; failures (e.g. read-only dir) are ignored."""
+    data = None
+    if agent is not None:
+        data = {
+            "name": agent.name,
+            "role": agent.role,
+            "system_prompt": agent.system_prompt,
+            "tools": agent.tools,
+        }
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(exist_ok=True)
+        tmp_file.write_bytes(orjson.dumps({"key": key, "agent": data}))
+        tmp_file.replace(cache_file)
+    except OSError as e:
+        logger.debug(f"Could not write persona cache {cache_file}: {e}")
+        tmp_file.unlink(missing_ok=True)
+
+
 def _parse_persona_file(path: Path) -> AgentDefinition | None:
     """Parse a persona Markdown file into an AgentDefinition."""
-    text = path.read_text(encoding="utf-8")
-    if not text.strip():
+    data = path.read_bytes()
+    if b"\r" in data:  # match read_text()'s universal-newline translation
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    if not data.strip():
         return None
 
     # Extract title (# heading)
-    title_match = re.match(r"^#\s+(.+)", text.strip())
-    name = title_match.group(1).strip() if title_match else path.stem.replace("_", " ").title()
-
-    # Extract sections
-    sections: dict[str, str] = {}
-    current_section: str | None = None
-    current_lines: list[str] = []
-
-    for line in text.split("\n"):
-        heading = re.match(r"^##\s+(.+)", line)
-        if heading:
-            if current_section:
-                sections[current_section] = "\n".join(current_lines).strip()
-            current_section = heading.group(1).strip().lower()
-            current_lines = []
-        elif current_section is not None:
-            current_lines.append(line)
-
-    if current_section:
-        sections[current_section] = "\n".join(current_lines).strip()
+    title_match = _TITLE_RE.match(data.strip())
+    if title_match:
+        name = title_match.group(1).decode("utf-8").strip()
+    else:
+        name = path.stem.replace("_", " ").title()
+
+    # Extract known sections; a body runs to the next "##" heading, and
+    # bodies of sections we don't use are never sliced out
+    sections: dict[bytes, bytes] = {}
+    current: bytes | None = None
+    start = 0
+    for heading in _H2_RE.finditer(data):
+        if current is not None:
+            sections[current] = data[start : heading.start()]
+        current = heading.group(1).strip().lower()
+        if current not in _PERSONA_SECTIONS:
+            current = None
+        start = heading.end()
+    if current is not None:
+        sections[current] = data[start:]
 
     # Build system prompt from all sections
-    role = sections.get("role", "Specialist agent")
-    expertise = sections.get("expertise", "")
-    capabilities = sections.get("capabilities", "")
-    guidelines = sections.get("guidelines", "")
-
-    prompt_parts = [f"You are a {name}.\n\n{role}"]
-    if expertise:
-        prompt_parts.append(f"Expertise:\n{expertise}")
-    if capabilities:
-        prompt_parts.append(f"Capabilities:\n{capabilities}")
-    if guidelines:
-        prompt_parts.append(f"Guidelines:\n{guidelines}")
+    role = _section_text(sections, b"role", "Specialist agent")
+    expertise = _section_text(sections, b"expertise")
+    capabilities = _section_text(sections, b"capabilities")
+    guidelines = _section_text(sections, b"guidelines")
+
+    system_prompt = (
+        f"You are a {name}.\n\n{role}"
+        + (f"\n\nExpertise:\n{expertise}" if expertise else "")
+        + (f"\n\nCapabilities:\n{capabilities}" if capabilities else "")
+        + (f"\n\nGuidelines:\n{guidelines}" if guidelines else "")
+    )
 
     # Extract tools list
-    tools_text = sections.get("tools", "")
-    tools = re.findall(r"-\s*(\w+)", tools_text) if tools_text else ["analyze", "complete"]
+    tools_text = _section_text(sections, b"tools")
+    tools = tuple(_TOOL_RE.findall(tools_text)) if tools_text else _TOOLS_REVIEW
 
     return AgentDefinition(
         agent_type=AgentType.ANALYST,  # custom personas use ANALYST as base type
         name=name,
         role=role,
-        system_prompt="\n\n".join(prompt_parts),
+        system_prompt=system_prompt,
         tools=tools,
     )
 
 
-# Global registry instance
-_registry: AgentRegistry | None = None
+def _section_text(sections: dict[bytes, bytes], key: bytes, default: str = "") -> str:
+    """Decode one section body, or return ``default`` if the section is absent."""
+    body = sections.get(key)
+    return default if body is None else body.decode("utf-8").strip()
 
 
+@functools.cache
 def get_agent_registry() -> AgentRegistry:
     """Get the global agent registry."""
-    global _registry
-    if _registry is None:
-        _registry = AgentRegistry()
-    return _registry
+    return AgentRegistry()
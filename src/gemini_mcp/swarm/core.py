@@ -1,16 +1,24 @@
 """Swarm orchestrator for multi-agent missions."""
 
 import asyncio
-import json
+import functools
+import hashlib
+import io
 import logging
 import re
+import sys
 import time
 import uuid
+from collections import deque
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from datetime import datetime
 
+import orjson
+
 from ..config import config
 from ..core.gemini import GeminiRequest, get_client
+from ..core.response import GeminiResponse
 from .agents import AgentDefinition, get_agent_registry
 from .memory import (
     get_swarm_registry,
@@ -33,6 +41,77 @@ logger = logging.getLogger(__name__)
 # Maximum turns any single mission may take (hard ceiling).
 _MAX_TURNS = config.swarm_max_turns
 
+# Architect action openers (arguments are found by _closing_paren), delegate
+# targets, and the JSON object in model replies
+_ACTION_RE = re.compile(r"(delegate|complete)\(", re.IGNORECASE)
+_PAREN_RE = re.compile(r"[()]")
+_MAX_DELEGATE_ARGS = 2000  # longest delegate(...) argument list we accept
+_AGENT_NAME_RE = re.compile(r"\w+")
+_EARLIER_RESULT_CHARS = 500  # excerpt kept for results outside the history window
+_JSON_BLOCK_RE = re.compile(r"\{[\s\S]*\}")
+
+
+def _closing_paren(text: str, start: int, end: int = sys.maxsize) -> int:
+    """Return the index of the ``)`` balancing an ``(`` just before *start*.
+
+    Scans ``text[start:end]`` once, jumping between parentheses; returns -1
+    if the call is not closed within that range.
+    """
+    depth = 1
+    for paren in _PAREN_RE.finditer(text, start, end):
+        if paren.group() == "(":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return paren.start()
+    return -1
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_agent_type(name: str) -> AgentType | None:
+    """Map an agent name from model output to a built-in type (case-insensitive)."""
+    try:
+        return AgentType(name.lower())
+    except ValueError:
+        return None
+
+
+# (agent name, 16-byte digest of the task) — identifies a repeatable delegation
+_DelegationKey = tuple[str, bytes]
+
+
+def _delegation_key(agent_def: AgentDefinition, task: str) -> _DelegationKey:
+    """Key a delegation by agent and task text.
+
+    Keyed by name rather than type: custom personas all share ANALYST.
+    """
+    return agent_def.name, hashlib.blake2b(task.encode(), digest_size=16).digest()
+
+
+@dataclass(slots=True)
+class _DelegationLog:
+    """Delegation results of one mission, as parallel lists in arrival order."""
+
+    types: list[AgentType] = field(default_factory=list)
+    results: list[str] = field(default_factory=list)
+    used: set[AgentType] = field(default_factory=set)  # every agent resolved so far
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def add(self, agent_type: AgentType, result: str) -> None:
+        """Record a finished delegation."""
+        self.types.append(agent_type)
+        self.results.append(result)
+
+    def last_result(self, agent_type: AgentType) -> str | None:
+        """Return the most recent result from *agent_type*, if any."""
+        for i in range(len(self.types) - 1, -1, -1):
+            if self.types[i] is agent_type:
+                return self.results[i]
+        return None
+
 
 class SwarmOrchestrator:
     """Orchestrator for multi-agent swarm missions.
@@ -43,6 +122,9 @@ class SwarmOrchestrator:
     iterative loop with depth/turn limits.
     """
 
+    # (custom persona names, footer) from the last _action_footer() build
+    _action_footer_cache: tuple[tuple[str, ...], str] | None = None
+
     def __init__(self) -> None:
         self.registry = get_agent_registry()
         self.trace_store = get_trace_store()
@@ -64,7 +146,7 @@ class SwarmOrchestrator:
     ) -> SwarmResult:
         """Execute a multi-agent mission."""
         trace_id = str(uuid.uuid4())[:8]
-        start_time = time.time()
+        start_time = time.monotonic()
         agents = agents or [AgentType.ARCHITECT]
 
         trace = ExecutionTrace(
@@ -85,7 +167,7 @@ class SwarmOrchestrator:
                     status=TaskStatus.IN_PROGRESS,
                     result="Mission started in background",
                     agents_used=agents,
-                    elapsed_seconds=time.time() - start_time,
+                    elapsed_seconds=time.monotonic() - start_time,
                 )
             else:
                 return await self._run_mission(trace, context, progress_callback)
@@ -94,7 +176,7 @@ class SwarmOrchestrator:
             logger.exception(f"Mission failed: {e}")
             trace.status = TaskStatus.FAILED
             trace.error = str(e)
-            self.trace_store.save(trace)
+            await asyncio.to_thread(self.trace_store.save, trace)
             await self.swarm_registry.unregister(trace_id)
 
             return SwarmResult(
@@ -102,7 +184,7 @@ class SwarmOrchestrator:
                 status=TaskStatus.FAILED,
                 error=str(e),
                 agents_used=agents,
-                elapsed_seconds=time.time() - start_time,
+                elapsed_seconds=time.monotonic() - start_time,
             )
 
     # ------------------------------------------------------------------
@@ -125,7 +207,7 @@ class SwarmOrchestrator:
             trace.status = TaskStatus.FAILED
             trace.error = str(e)
             trace.completed_at = datetime.now()
-            self.trace_store.save(trace)
+            await asyncio.to_thread(self.trace_store.save, trace)
         finally:
             # Ensure cleanup even on cancellation (CancelledError bypasses except Exception)
             if self.swarm_registry.is_running(trace.trace_id):
@@ -142,12 +224,20 @@ class SwarmOrchestrator:
         progress_callback: Callable[[float, str], Awaitable[None]] | None = None,
     ) -> SwarmResult:
         """Execute the mission with architect-led delegation loop."""
-        start_time = time.time()
+        start_time = time.monotonic()
         timeout = config.activity_timeout  # hard timeout for the whole mission
         turn = 0
         max_turns = min(_MAX_TURNS, self.max_depth * 4)  # bounded by config depth
-        agent_results: dict[str, str] = {}  # agent_type -> result
-        agents_used: set[AgentType] = set(trace.agents_used)
+        log = _DelegationLog(used=set(trace.agents_used))
+        answered: dict[_DelegationKey, str] = {}  # successful results, for reuse
+        # Prompt text that doesn't change between turns is built once; each
+        # delegation result is appended to the log as it arrives
+        prompt_prefix = self._build_prompt_prefix(trace.objective, context)
+        # Only the newest results are shown in full; evicted ones leave a
+        # short excerpt in the "earlier results" section (FIFO + summary)
+        history_window = config.swarm_history_window
+        recent_results: deque[tuple[str, str]] = deque()  # (prompt entry, excerpt)
+        earlier_results = io.StringIO()
 
         try:
             architect = self.registry.get(AgentType.ARCHITECT)
@@ -155,7 +245,7 @@ class SwarmOrchestrator:
             # ---- Turn loop -------------------------------------------------
             while turn < max_turns:
                 turn += 1
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 if elapsed > timeout:
                     logger.warning(f"Mission {trace.trace_id} timed out after {elapsed:.0f}s")
                     break
@@ -169,11 +259,11 @@ class SwarmOrchestrator:
 
                 # Build architect prompt including delegation results
                 prompt = self._build_architect_prompt(
-                    trace.objective,
-                    context,
-                    agent_results,
+                    prompt_prefix,
+                    "".join(entry for entry, _ in recent_results),
                     turn,
                     max_turns,
+                    summary=earlier_results.getvalue(),
                 )
 
                 request = GeminiRequest(
@@ -195,8 +285,7 @@ class SwarmOrchestrator:
                 )
 
                 # ---- Parse structured actions from architect output --------
-                delegations = self._parse_delegations(text)
-                completed = self._parse_completion(text)
+                delegations, completed = self._parse_actions(text)
 
                 if completed is not None:
                     # Architect signalled completion.
@@ -204,8 +293,8 @@ class SwarmOrchestrator:
                     trace.status = TaskStatus.COMPLETED
                     trace.completed_at = datetime.now()
                     trace.total_turns = turn
-                    trace.agents_used = list(agents_used)
-                    self.trace_store.save(trace)
+                    trace.agents_used = list(log.used)
+                    await asyncio.to_thread(self.trace_store.save, trace)
                     await self.swarm_registry.unregister(trace.trace_id)
 
                     if progress_callback:
@@ -218,43 +307,33 @@ class SwarmOrchestrator:
                         trace_id=trace.trace_id,
                         status=TaskStatus.COMPLETED,
                         result=completed,
-                        agents_used=list(agents_used),
-                        tasks_completed=len(agent_results) + 1,
+                        agents_used=list(log.used),
+                        tasks_completed=len(log) + 1,
                         total_turns=turn,
-                        elapsed_seconds=time.time() - start_time,
+                        elapsed_seconds=time.monotonic() - start_time,
                     )
 
                 if delegations:
-                    # Execute delegations (up to max_depth concurrent)
+                    # Execute delegations (up to max_depth) concurrently
                     # Time budget: remaining time from mission timeout
-                    remaining_time = max(10.0, timeout - (time.time() - start_time))
+                    remaining_time = max(10.0, timeout - (time.monotonic() - start_time))
+                    pending: list[tuple[str, AgentType, _DelegationKey]] = []
+                    # Identical delegations (same agent, same task) run once;
+                    # ones already answered earlier in the mission are reused
+                    to_run: dict[_DelegationKey, tuple[AgentDefinition, str]] = {}
                     for agent_name, task_desc in delegations[: self.max_depth]:
-                        # Try built-in agent types first, then custom personas
-                        agent_def = None
-                        agent_type = None
-                        try:
-                            agent_type = AgentType(agent_name.lower())
-                            agent_def = self.registry.get(agent_type)
-                        except ValueError:
-                            # Check custom personas
-                            try:
-                                if self.registry.has_custom(agent_name):
-                                    agent_def = self.registry.get_by_name(agent_name)
-                                    agent_type = agent_def.agent_type
-                                else:
-                                    logger.warning(
-                                        f"Unknown agent '{agent_name}', skipping delegation"
-                                    )
-                                    continue
-                            except (ValueError, KeyError):
-                                logger.warning(
-                                    f"Failed to resolve agent '{agent_name}', skipping delegation"
-                                )
-                                continue
-
-                        agents_used.add(agent_type)
-                        try:
-                            sub_result = await asyncio.wait_for(
+                        resolved = self._resolve_agent(agent_name)
+                        if resolved is not None:
+                            agent_type, agent_def = resolved
+                            log.used.add(agent_type)
+                            key = _delegation_key(agent_def, task_desc)
+                            pending.append((agent_name, agent_type, key))
+                            if key not in answered:
+                                to_run.setdefault(key, (agent_def, task_desc))
+
+                    outcomes = await asyncio.gather(
+                        *(
+                            asyncio.wait_for(
                                 self._execute_agent(
                                     agent_def,
                                     task_desc,
@@ -263,12 +342,33 @@ class SwarmOrchestrator:
                                 ),
                                 timeout=remaining_time,
                             )
-                        except TimeoutError:
+                            for agent_def, task_desc in to_run.values()
+                        ),
+                        return_exceptions=True,
+                    )
+                    fresh = dict(zip(to_run, outcomes, strict=True))
+
+                    # Record results in delegation order
+                    for agent_name, agent_type, key in pending:
+                        outcome = fresh[key] if key in fresh else answered[key]
+                        if isinstance(outcome, TimeoutError):
                             logger.warning(
                                 f"Agent {agent_name} timed out after {remaining_time:.0f}s"
                             )
                             sub_result = f"[Agent {agent_name} timed out]"
-                        agent_results[agent_type.value] = sub_result
+                        elif isinstance(outcome, BaseException):
+                            raise outcome
+                        else:
+                            sub_result = answered[key] = outcome
+                        log.add(agent_type, sub_result)
+                        recent_results.append(
+                            (
+                                self._format_agent_result(agent_type.value, sub_result),
+                                self._excerpt_agent_result(agent_type.value, sub_result),
+                            )
+                        )
+                        if len(recent_results) > history_window:
+                            earlier_results.write(recent_results.popleft()[1])
                         trace.messages.append(
                             SwarmMessage(
                                 role="assistant",
@@ -282,8 +382,8 @@ class SwarmOrchestrator:
                     trace.status = TaskStatus.COMPLETED
                     trace.completed_at = datetime.now()
                     trace.total_turns = turn
-                    trace.agents_used = list(agents_used)
-                    self.trace_store.save(trace)
+                    trace.agents_used = list(log.used)
+                    await asyncio.to_thread(self.trace_store.save, trace)
                     await self.swarm_registry.unregister(trace.trace_id)
 
                     if progress_callback:
@@ -296,15 +396,15 @@ class SwarmOrchestrator:
                         trace_id=trace.trace_id,
                         status=TaskStatus.COMPLETED,
                         result=text,
-                        agents_used=list(agents_used),
-                        tasks_completed=len(agent_results) + 1,
+                        agents_used=list(log.used),
+                        tasks_completed=len(log) + 1,
                         total_turns=turn,
-                        elapsed_seconds=time.time() - start_time,
+                        elapsed_seconds=time.monotonic() - start_time,
                     )
 
             # ---- Exhausted turns / timed out ----------------------------
             final = (
-                agent_results.get("architect") or trace.messages[-1].content
+                log.last_result(AgentType.ARCHITECT) or trace.messages[-1].content
                 if trace.messages
                 else ""
             )
@@ -312,18 +412,18 @@ class SwarmOrchestrator:
             trace.status = TaskStatus.COMPLETED
             trace.completed_at = datetime.now()
             trace.total_turns = turn
-            trace.agents_used = list(agents_used)
-            self.trace_store.save(trace)
+            trace.agents_used = list(log.used)
+            await asyncio.to_thread(self.trace_store.save, trace)
             await self.swarm_registry.unregister(trace.trace_id)
 
             return SwarmResult(
                 trace_id=trace.trace_id,
                 status=TaskStatus.COMPLETED,
                 result=final,
-                agents_used=list(agents_used),
-                tasks_completed=len(agent_results),
+                agents_used=list(log.used),
+                tasks_completed=len(log),
                 total_turns=turn,
-                elapsed_seconds=time.time() - start_time,
+                elapsed_seconds=time.monotonic() - start_time,
             )
 
         except Exception as e:
@@ -331,54 +431,85 @@ class SwarmOrchestrator:
             trace.status = TaskStatus.FAILED
             trace.error = str(e)
             trace.completed_at = datetime.now()
-            self.trace_store.save(trace)
+            await asyncio.to_thread(self.trace_store.save, trace)
             await self.swarm_registry.unregister(trace.trace_id)
 
             return SwarmResult(
                 trace_id=trace.trace_id,
                 status=TaskStatus.FAILED,
                 error=str(e),
-                agents_used=list(agents_used),
-                elapsed_seconds=time.time() - start_time,
+                agents_used=list(log.used),
+                elapsed_seconds=time.monotonic() - start_time,
             )
 
     # ------------------------------------------------------------------
     # Prompt building
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _build_prompt_prefix(objective: str, context: str) -> str:
+        """Build the part of the architect prompt that is fixed for a mission."""
+        if context:
+            return f"Mission Objective: {objective}\n\nContext: {context}"
+        return f"Mission Objective: {objective}"
+
+    @staticmethod
+    def _format_agent_result(agent_name: str, result: str) -> str:
+        """Format one delegation result for the architect's results log."""
+        return f"\n\n\n[{agent_name}]:\n{result[: config.result_truncation_chars]}"
+
+    @staticmethod
+    def _excerpt_agent_result(agent_name: str, result: str) -> str:
+        """Shorten a result that has left the history window."""
+        return f"\n- [{agent_name}]: {result[:_EARLIER_RESULT_CHARS]}"
+
     def _build_architect_prompt(
         self,
-        objective: str,
-        context: str,
-        agent_results: dict[str, str],
+        prefix: str,
+        results: str,
         turn: int,
         max_turns: int,
+        summary: str = "",
     ) -> str:
-        """Build the architect prompt including prior delegation results."""
-        parts = [
-            f"Mission Objective: {objective}",
-        ]
-        if context:
-            parts.append(f"Context: {context}")
+        """Build the architect prompt for one turn.
+
+        Args:
+            prefix: Output of ``_build_prompt_prefix`` for this mission.
+            results: Concatenated ``_format_agent_result`` entries in the
+                history window.
+            turn: Current turn number.
+            max_turns: Turn limit for the mission.
+            summary: Concatenated ``_excerpt_agent_result`` entries for
+                results older than the window.
+        """
+        if summary:
+            prefix = f"{prefix}\n\n[Earlier results summary]:{summary}"
+        if results:
+            results = (
+                f"\n\n\n--- Results from delegated agents ---{results}"
+                "\n\n--- End of agent results ---\n"
+            )
+        return f"{prefix}{results}\n\nTurn {turn}/{max_turns}.\n\n{self._action_footer()}"
 
-        if agent_results:
-            parts.append("\n--- Results from delegated agents ---")
-            for agent_name, result in agent_results.items():
-                parts.append(f"\n[{agent_name}]:\n{result[:config.result_truncation_chars]}")
-            parts.append("--- End of agent results ---\n")
+    def _action_footer(self) -> str:
+        """Return the action list + available agents block of the prompt.
 
-        parts.append(f"Turn {turn}/{max_turns}.")
+        Rebuilt only when the set of custom personas changes.
+        """
+        custom_names = tuple(self.registry.list_custom_agents())
+        cached = self._action_footer_cache
+        if cached is not None and cached[0] == custom_names:
+            return cached[1]
 
         # Build available agents list including custom personas
         builtin = "researcher, coder, analyst, reviewer, tester, documenter"
-        custom_names = self.registry.list_custom_agents()
         if custom_names:
             custom_list = ", ".join(n.lower().replace(" ", "_") for n in custom_names)
             agents_line = f"Available agents: {builtin}, {custom_list}"
         else:
             agents_line = f"Available agents: {builtin}"
 
-        parts.append(
+        footer = (
             "Actions:\n"
             "  delegate(agent_name, task_description) — assign work to a specialist\n"
             "  complete(final_result) — finish the mission with your answer\n\n"
@@ -386,43 +517,79 @@ class SwarmOrchestrator:
             "If you can answer directly, use complete(your_answer). "
             "Otherwise delegate sub-tasks, then integrate results on the next turn."
         )
-        return "\n\n".join(parts)
+        self._action_footer_cache = (custom_names, footer)
+        return footer
 
     # ------------------------------------------------------------------
     # Action parsing
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _parse_delegations(text: str) -> list[tuple[str, str]]:
-        """Extract delegate(agent, task) calls from architect output.
-
-        Uses ``[^)]{1,2000}`` instead of ``.*?`` with optional quotes to
-        prevent catastrophic backtracking (ReDoS) on malformed input.
+    def _parse_actions(text: str) -> tuple[list[tuple[str, str]], str | None]:
+        """Extract delegate(agent, task) calls and complete(result) in one pass.
+
+        Arguments run to the balancing ``)``, so they may contain
+        parentheses; delegate arguments are capped at ``_MAX_DELEGATE_ARGS``
+        characters, which keeps the scan linear on malformed input. Text
+        inside a delegate call is not scanned for further actions. The
+        first non-empty complete() ends the scan; if it is never balanced,
+        its result runs to the last ``)`` in the text.
+
+        Returns:
+            ``(delegations, completion)``; completion is None if absent.
         """
-        results: list[tuple[str, str]] = []
-        for match in re.finditer(r"delegate\(([^)]{1,2000})\)", text, re.IGNORECASE):
-            inner = match.group(1).strip()
-            parts = inner.split(",", 1)
+        delegations: list[tuple[str, str]] = []
+        pos = 0
+        while match := _ACTION_RE.search(text, pos):
+            start = match.end()
+            if match.group(1).lower() == "complete":
+                end = _closing_paren(text, start)
+                if end == -1:
+                    end = text.rfind(")", start)
+                    if end == -1:
+                        break
+                result = text[start:end].strip().strip("\"'")
+                if result:
+                    return delegations, result
+                pos = end + 1
+                continue
+
+            end = _closing_paren(text, start, start + _MAX_DELEGATE_ARGS + 1)
+            if end <= start:  # unclosed, too long, or empty
+                pos = start
+                continue
+            pos = end + 1
+            parts = text[start:end].strip().split(",", 1)
             if len(parts) == 2:
                 agent = parts[0].strip().strip("\"'")
                 task = parts[1].strip().strip("\"'")
-                if re.fullmatch(r"\w+", agent):
-                    results.append((agent, task))
-        return results
-
-    @staticmethod
-    def _parse_completion(text: str) -> str | None:
-        """Extract complete(result) from architect output."""
-        match = re.search(r"complete\((.*)\)", text, re.DOTALL | re.IGNORECASE)
-        if match:
-            result = match.group(1).strip().strip("\"'")
-            return result if result else None
-        return None
+                if _AGENT_NAME_RE.fullmatch(agent):
+                    delegations.append((agent, task))
+        return delegations, None
 
     # ------------------------------------------------------------------
     # Sub-agent execution
     # ------------------------------------------------------------------
 
+    def _resolve_agent(self, agent_name: str) -> tuple[AgentType, AgentDefinition] | None:
+        """Resolve a delegation target (built-in type first, then custom persona).
+
+        Returns None (after logging) when the name matches neither.
+        """
+        agent_type = _resolve_agent_type(agent_name)
+        if agent_type is not None:
+            return agent_type, self.registry.get(agent_type)
+
+        try:
+            if not self.registry.has_custom(agent_name):
+                logger.warning(f"Unknown agent '{agent_name}', skipping delegation")
+                return None
+            agent_def = self.registry.get_by_name(agent_name)
+            return agent_def.agent_type, agent_def
+        except (ValueError, KeyError):
+            logger.warning(f"Failed to resolve agent '{agent_name}', skipping delegation")
+            return None
+
     async def _execute_agent(
         self,
         agent_def: AgentDefinition,
@@ -459,7 +626,7 @@ class SwarmOrchestrator:
     ) -> AdjudicationResult:
         """Convene an expert panel for consensus."""
         trace_id = str(uuid.uuid4())[:8]
-        start_time = time.time()
+        start_time = time.monotonic()
 
         if not panel_personas:
             panel_personas = ["architect", "analyst", "reviewer"]
@@ -472,75 +639,88 @@ class SwarmOrchestrator:
             )
             panel_personas = panel_personas[:max_panel_size]
 
-        votes: list[PanelVote] = []
-
-        for i, persona_name in enumerate(panel_personas):
+        async def report(progress: float, message: str) -> None:
             if progress_callback:
                 try:
-                    progress = (i + 1) / (len(panel_personas) + 1)
-                    await progress_callback(progress, f"Expert {persona_name} deliberating...")
+                    await progress_callback(progress, message)
                 except Exception:
                     logger.warning("Progress callback failed", exc_info=True)
 
-            try:
-                agent_type = AgentType(persona_name.lower())
-                agent = self.registry.get(agent_type)
-            except (ValueError, KeyError):
-                logger.warning(f"Unknown persona: {persona_name}, using analyst")
-                agent_type = AgentType.ANALYST
-                agent = self.registry.get(agent_type)
+        # Collect votes concurrently (bounded by swarm_max_agents). Opinion
+        # lines for the judge are filled in panel order as votes land, and
+        # the judge is dispatched as soon as the last one arrives.
+        semaphore = asyncio.Semaphore(config.swarm_max_agents)
 
-            prompt = f"""As a {agent.role}, provide your expert position on:
+        async def bounded_vote(index: int, persona_name: str) -> tuple[int, str, PanelVote]:
+            async with semaphore:
+                return index, persona_name, await self._collect_vote(persona_name, query)
 
-{query}
-
-Respond in JSON with these fields:
-- "position": your clear recommendation
-- "reasoning": supporting arguments
-- "confidence": float 0.0 to 1.0
-- "concerns": list of caveats"""
+        panel_size = len(panel_personas)
+        tasks = [asyncio.create_task(bounded_vote(i, p)) for i, p in enumerate(panel_personas)]
+        opinions = [""] * panel_size
+        synthesis: asyncio.Task[GeminiResponse] | None = None
+        try:
+            last_voter = ""
+            for i, next_done in enumerate(asyncio.as_completed(tasks)):
+                index, persona_name, vote = await next_done
+                opinions[index] = (
+                    f"- {vote.agent_type.value} (confidence {vote.confidence:.2f}): "
+                    f"{vote.position[:500]}..."
+                )
+                if i + 1 < panel_size:
+                    await report((i + 1) / (panel_size + 1), f"Expert {persona_name} has voted")
+                else:
+                    last_voter = persona_name
 
-            request = GeminiRequest(
-                prompt=prompt,
-                system_instruction=agent.system_prompt,
-                model=agent.model or self.client.default_model,
+            synthesis = asyncio.create_task(
+                self.client.generate(self._synthesis_request(query, opinions))
             )
+            await report(panel_size / (panel_size + 1), f"Expert {last_voter} has voted")
+            await report(0.9, "Synthesizing verdict...")
+            verdict_response = await synthesis
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            if synthesis is not None:
+                synthesis.cancel()
+            raise
+        votes = [task.result()[2] for task in tasks]
 
-            response = await self.client.generate(request)
-
-            # Parse confidence from structured output if possible
-            parsed_confidence = 0.8
-            try:
-                json_match = re.search(r"\{[\s\S]*\}", response.text)
-                if json_match:
-                    parsed = json.loads(json_match.group())
-                    parsed_confidence = float(parsed.get("confidence", 0.8))
-                    parsed_confidence = max(0.0, min(1.0, parsed_confidence))
-            except Exception:
-                pass
-
-            votes.append(
-                PanelVote(
-                    agent_type=agent_type,
-                    position=response.text,
-                    reasoning="",
-                    confidence=parsed_confidence,
-                )
-            )
+        # Parse synthesis for dynamic confidence + dissent
+        overall_confidence = sum(v.confidence for v in votes) / max(len(votes), 1)
+        dissenting: list[str] = []
+        try:
+            json_match = _JSON_BLOCK_RE.search(verdict_response.text)
+            if json_match:
+                parsed = orjson.loads(json_match.group())
+                overall_confidence = float(parsed.get("confidence", overall_confidence))
+                overall_confidence = max(0.0, min(1.0, overall_confidence))
+                dissenting = parsed.get("dissenting_opinions", [])
+                if isinstance(dissenting, str):
+                    dissenting = [dissenting]
+        except Exception:
+            pass
 
-        # Synthesize verdict
-        if progress_callback:
-            try:
-                await progress_callback(0.9, "Synthesizing verdict...")
-            except Exception:
-                logger.warning("Progress callback failed", exc_info=True)
+        return AdjudicationResult(
+            trace_id=trace_id,
+            query=query,
+            verdict=verdict_response.text,
+            reasoning="",
+            confidence=overall_confidence,
+            panel_votes=votes,
+            dissenting_opinions=dissenting,
+            elapsed_seconds=time.monotonic() - start_time,
+        )
 
+    @staticmethod
+    def _synthesis_request(query: str, opinions: list[str]) -> GeminiRequest:
+        """Build the judge's request from the panel's formatted opinions."""
         synthesis_prompt = f"""As the presiding judge, synthesize these expert opinions:
 
 Query: {query}
 
 Expert Opinions:
-{chr(10).join([f"- {v.agent_type.value} (confidence {v.confidence:.2f}): {v.position[:500]}..." for v in votes])}
+{chr(10).join(opinions)}
 
 Provide in JSON:
 - "verdict": final verdict
@@ -548,37 +728,53 @@ Provide in JSON:
 - "confidence": overall confidence (0.0-1.0)
 - "dissenting_opinions": list of notable disagreements"""
 
-        request = GeminiRequest(
+        return GeminiRequest(
             prompt=synthesis_prompt,
             system_instruction="You are a fair and balanced judge synthesizing expert opinions.",
         )
 
-        verdict_response = await self.client.generate(request)
+    async def _collect_vote(self, persona_name: str, query: str) -> PanelVote:
+        """Ask one panel persona for its position on *query*."""
+        agent_type = _resolve_agent_type(persona_name)
+        if agent_type is None:
+            logger.warning(f"Unknown persona: {persona_name}, using analyst")
+            agent_type = AgentType.ANALYST
+        agent = self.registry.get(agent_type)
 
-        # Parse synthesis for dynamic confidence + dissent
-        overall_confidence = sum(v.confidence for v in votes) / max(len(votes), 1)
-        dissenting: list[str] = []
+        prompt = f"""As a {agent.role}, provide your expert position on:
+
+{query}
+
+Respond in JSON with these fields:
+- "position": your clear recommendation
+- "reasoning": supporting arguments
+- "confidence": float 0.0 to 1.0
+- "concerns": list of caveats"""
+
+        request = GeminiRequest(
+            prompt=prompt,
+            system_instruction=agent.system_prompt,
+            model=agent.model or self.client.default_model,
+        )
+
+        response = await self.client.generate(request)
+
+        # Parse confidence from structured output if possible
+        parsed_confidence = 0.8
         try:
-            json_match = re.search(r"\{[\s\S]*\}", verdict_response.text)
+            json_match = _JSON_BLOCK_RE.search(response.text)
             if json_match:
-                parsed = json.loads(json_match.group())
-                overall_confidence = float(parsed.get("confidence", overall_confidence))
-                overall_confidence = max(0.0, min(1.0, overall_confidence))
-                dissenting = parsed.get("dissenting_opinions", [])
-                if isinstance(dissenting, str):
-                    dissenting = [dissenting]
+                parsed = orjson.loads(json_match.group())
+                parsed_confidence = float(parsed.get("confidence", 0.8))
+                parsed_confidence = max(0.0, min(1.0, parsed_confidence))
         except Exception:
             pass
 
-        return AdjudicationResult(
-            trace_id=trace_id,
-            query=query,
-            verdict=verdict_response.text,
+        return PanelVote(
+            agent_type=agent_type,
+            position=response.text,
             reasoning="",
-            confidence=overall_confidence,
-            panel_votes=votes,
-            dissenting_opinions=dissenting,
-            elapsed_seconds=time.time() - start_time,
+            confidence=parsed_confidence,
         )
 
     # ------------------------------------------------------------------
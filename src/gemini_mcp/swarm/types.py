@@ -1,5 +1,6 @@
 """Type definitions for the Swarm system."""
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
@@ -88,7 +89,7 @@ class SwarmMessage:
     role: str  # user, assistant, system
     content: str
     agent_type: AgentType | None = None
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: float = field(default_factory=time.time)  # epoch seconds
     tool_calls: list[dict] = field(default_factory=list)
 
 
@@ -7,7 +7,6 @@ This module implements the primary tools:
 """
 
 import logging
-import os
 from pathlib import Path
 from typing import Literal
 
@@ -70,9 +69,9 @@ _SENSITIVE_PATHS = frozenset(
 
 def _get_allowed_roots() -> list[Path]:
     """Return resolved allowed base directories for path operations."""
-    raw = os.getenv("GEMINI_MCP_ALLOWED_PATHS", "").strip()
-    if raw:
-        return [Path(p).resolve() for p in raw.split(":") if p.strip()]
+    configured = config.allowed_path_roots
+    if configured:
+        return list(configured)
     # Default: CWD + /tmp + home directory
     roots = [Path.cwd().resolve(), Path("/tmp").resolve()]
     home = Path.home().resolve()
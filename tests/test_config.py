@@ -68,6 +68,18 @@ class TestConfig:
         config = GeminiMCPConfig()
         assert config.max_context_tokens == 900_000
 
+    def test_storage_path_defaults(self, monkeypatch, tmp_path):
+        """Test storage paths default under $HOME and honour env overrides."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("GEMINI_MCP_LOG_DIR", "/var/log/gemini-mcp")
+        config = GeminiMCPConfig()
+
+        base = tmp_path / ".gemini-mcp"
+        assert config.data_dir == base
+        assert config.context_cache_dir == base / "context-cache"
+        assert config.debate_storage_dir == base / "debates"
+        assert str(config.log_dir) == "/var/log/gemini-mcp"
+
 
 class TestConfigValidation:
     """Tests for Pydantic field validators."""
@@ -151,6 +163,24 @@ class TestConfigValidation:
         with pytest.raises(ValidationError, match="max_context_tokens"):
             GeminiMCPConfig()
 
+    def test_debate_rounds_zero_rejected(self, monkeypatch):
+        """Zero debate rounds should be rejected."""
+        monkeypatch.setenv("GEMINI_MCP_DEBATE_MIN_ROUNDS", "0")
+        with pytest.raises(ValidationError, match="debate_min_rounds"):
+            GeminiMCPConfig()
+
+    def test_config_is_frozen(self):
+        """Config fields cannot be reassigned after load."""
+        config = GeminiMCPConfig()
+        with pytest.raises(ValidationError, match="frozen"):
+            config.server_port = 9000
+        assert config.plugin_allowlist_set is None
+
+    def test_separator_only_plugin_allowlist_blocks_all(self, monkeypatch):
+        """An allowlist that names no files is configured, not unset."""
+        monkeypatch.setenv("GEMINI_MCP_PLUGIN_ALLOWLIST", ", ,")
+        assert GeminiMCPConfig().plugin_allowlist_set == frozenset()
+
 
 class TestAuthChain:
     """Tests for GeminiClient credential loading."""
@@ -161,14 +191,16 @@ class TestAuthChain:
 
         monkeypatch.setenv("GOOGLE_API_KEY", "test-key-123")
 
-        with patch("gemini_mcp.core.gemini.genai.Client") as mock_client_cls:
+        with patch("google.genai.Client") as mock_client_cls:
             mock_client_cls.return_value = MagicMock()
             from gemini_mcp.core.gemini import GeminiClient
 
             client = GeminiClient()
+            # genai.Client is built lazily on first access
+            mock_client_cls.assert_not_called()
 
-            mock_client_cls.assert_called_once_with(api_key="test-key-123")
             assert client.client is not None
+            mock_client_cls.assert_called_once_with(api_key="test-key-123")
 
     def test_missing_credentials_still_initializes(self, monkeypatch, tmp_path):
         """Server should start even without valid credentials."""
@@ -179,7 +211,7 @@ class TestAuthChain:
         # Point HOME to tmp_path so no .gemini/oauth_creds.json exists
         monkeypatch.setenv("HOME", str(tmp_path))
 
-        with patch("gemini_mcp.core.gemini.genai.Client") as mock_client_cls:
+        with patch("google.genai.Client") as mock_client_cls:
             mock_client_cls.return_value = MagicMock()
             from gemini_mcp.core.gemini import GeminiClient
 
@@ -211,7 +243,7 @@ class TestAuthChain:
         )
         monkeypatch.setenv("HOME", str(tmp_path))
 
-        with patch("gemini_mcp.core.gemini.genai.Client") as mock_client_cls:
+        with patch("google.genai.Client") as mock_client_cls:
             mock_client_cls.return_value = MagicMock()
             from gemini_mcp.core.gemini import GeminiClient
 
@@ -227,10 +259,134 @@ class TestAuthChain:
 
         monkeypatch.setenv("GOOGLE_API_KEY", "bad-key")
 
-        with patch("gemini_mcp.core.gemini.genai.Client", side_effect=Exception("Auth failed")):
+        with patch("google.genai.Client", side_effect=Exception("Auth failed")):
             from gemini_mcp.core.gemini import GeminiClient
 
             client = GeminiClient()
 
             # Should not crash; client set to None
             assert client.client is None
+
+    def test_oauth_creds_file_cached_by_mtime(self, tmp_path):
+        """The creds JSON is parsed once per file modification."""
+        import json as _json
+        import os
+
+        from gemini_mcp.core.gemini import _read_creds_file
+
+        creds_file = tmp_path / "oauth_creds.json"
+        creds_file.write_text(_json.dumps({"access_token": "first"}))
+        mtime_ns = creds_file.stat().st_mtime_ns
+
+        _read_creds_file.cache_clear()
+        assert _read_creds_file(str(creds_file), mtime_ns)["access_token"] == "first"
+
+        # Same mtime → cached result, even if contents changed underneath
+        creds_file.write_text(_json.dumps({"access_token": "second"}))
+        os.utime(creds_file, ns=(mtime_ns, mtime_ns))
+        assert _read_creds_file(str(creds_file), mtime_ns)["access_token"] == "first"
+
+        # New mtime → re-read
+        new_mtime = mtime_ns + 1_000_000_000
+        os.utime(creds_file, ns=(new_mtime, new_mtime))
+        assert _read_creds_file(str(creds_file), new_mtime)["access_token"] == "second"
+        _read_creds_file.cache_clear()
+
+    def test_project_id_cache_roundtrip(self, tmp_path, monkeypatch):
+        """Cached project IDs are served immediately and flagged when stale."""
+        import time as _time
+
+        from gemini_mcp.core import gemini as gemini_mod
+
+        cache_file = tmp_path / "project_id.cache"
+        assert gemini_mod._read_project_cache(cache_file) == (None, False)
+
+        gemini_mod._write_project_cache(cache_file, "my-project")
+        assert gemini_mod._read_project_cache(cache_file) == ("my-project", True)
+
+        later = _time.time() + gemini_mod._PROJECT_CACHE_TTL + 1
+        monkeypatch.setattr(gemini_mod.time, "time", lambda: later)
+        assert gemini_mod._read_project_cache(cache_file) == ("my-project", False)
+
+    def test_cached_gen_config_not_shared_across_requests(self):
+        """Mutating one request's config doesn't leak into the next."""
+        from gemini_mcp.core.gemini import GeminiRequest, _build_gen_config
+
+        request = GeminiRequest(prompt="hi", temperature=0.3, system_instruction="be brief")
+        first = _build_gen_config(request)
+        first.temperature = 1.0
+        first.system_instruction = "changed"
+
+        second = _build_gen_config(request)
+        assert second is not first
+        assert second.temperature == 0.3
+        assert second.system_instruction == "be brief"
+
+    def test_http_client_closed_on_loop_change(self, monkeypatch):
+        """A client from a finished event loop is closed when it's replaced."""
+        import asyncio
+
+        from gemini_mcp.core import gemini as gemini_mod
+
+        monkeypatch.setattr(gemini_mod, "_http_client", None)
+        monkeypatch.setattr(gemini_mod, "_http_client_loop", None)
+
+        async def _get():
+            return gemini_mod._get_http_client()
+
+        async def _get_and_settle():
+            client = gemini_mod._get_http_client()
+            await asyncio.gather(*gemini_mod._http_client_closers)
+            return client
+
+        first = asyncio.run(_get())
+        second = asyncio.run(_get_and_settle())
+        assert second is not first
+        assert first.is_closed
+        assert not second.is_closed
+        asyncio.run(second.aclose())
+
+    def test_auth_error_detection(self):
+        """Typed status codes take precedence over message scanning."""
+        from gemini_mcp.core.gemini import _is_auth_error
+
+        class _CodedError(Exception):
+            def __init__(self, code: int) -> None:
+                super().__init__("Unauthenticated 401")
+                self.code = code
+
+        assert _is_auth_error(_CodedError(401), "") is True
+        assert _is_auth_error(_CodedError(500), "Unauthenticated 401") is False
+        assert _is_auth_error(Exception(), "401 Unauthorized") is True
+        assert _is_auth_error(Exception(), "quota exceeded") is False
+
+
+class TestResponseParsing:
+    """Tests for GeminiClient response parsing."""
+
+    def test_stats_optional(self):
+        """Usage stats are attached only when requested."""
+        from types import SimpleNamespace
+
+        from gemini_mcp.core.gemini import GeminiClient
+
+        usage = SimpleNamespace(prompt_token_count=3, candidates_token_count=5, total_token_count=8)
+        response = SimpleNamespace(text="hi", usage_metadata=usage)
+        client = GeminiClient()
+
+        parsed = client._parse_response(response, 0.25, "m", include_stats=True)
+        assert parsed.stats is not None
+        assert parsed.stats.total_tokens == 8
+        assert parsed.stats.duration_ms == 250
+
+        # No usage metadata: token counts are zero, duration is still reported
+        bare = SimpleNamespace(text="hi")
+        parsed = client._parse_response(bare, 0.25, "m", include_stats=True)
+        assert parsed.stats is not None
+        assert parsed.stats.total_tokens == 0
+        assert parsed.to_dict()["stats"]["duration_ms"] == 250
+
+        parsed = client._parse_response(response, 0.25, "m", include_stats=False)
+        assert parsed.text == "hi"
+        assert parsed.stats is None
+        assert "stats" not in parsed.to_dict()
@@ -7,6 +7,8 @@ from gemini_mcp.debate.orchestrator import (
     DebateResult,
     DebateStrategy,
     _cosine_similarity,
+    _NoveltyWindow,
+    _TermIndex,
     _tfidf_vector,
     _tokenize,
 )
@@ -65,6 +67,33 @@ class TestTFIDF:
         assert _cosine_similarity({}, {}) == 0.0
         assert _cosine_similarity({"a": 1.0}, {}) == 0.0
 
+    def test_term_index_idf_weighted_cosine(self):
+        """Index scores are TF-IDF cosines and forget discarded docs."""
+        topics = {
+            "d1": "machine learning trading",
+            "d2": "deep learning models",
+            "d3": "cooking recipes",
+        }
+        index = _TermIndex()
+        for stem, topic in topics.items():
+            index.add(stem, _tfidf_vector(topic))
+
+        # "learning" appears in two topics, "machine" in one
+        assert index.idf("machine") > index.idf("learning")
+
+        query = _tfidf_vector("machine learning algorithms")
+        scores = index.cosine_scores(query)
+        assert set(scores) == {"d1", "d2"}
+        assert scores["d1"] > scores["d2"]
+        for stem, score in scores.items():
+            expected = _cosine_similarity(
+                index.weighted(query), index.weighted(_tfidf_vector(topics[stem]))
+            )
+            assert score == pytest.approx(expected)
+
+        index.discard({"d1"})
+        assert set(index.cosine_scores(query)) == {"d2"}
+
 
 class TestDebateMemory:
     """Tests for debate memory persistence."""
@@ -171,6 +200,235 @@ class TestDebateMemory:
         assert stats["total_insights"] == 6  # 3 * 2 consensus points
         assert stats["convergence_rate"] == pytest.approx(2 / 3)
 
+    def test_find_related_reads_legacy_files(self, tmp_path, monkeypatch):
+        """Debates saved without precomputed TF vectors are still scored."""
+        import json
+
+        monkeypatch.setattr(
+            "gemini_mcp.debate.orchestrator.config",
+            type(
+                "C",
+                (),
+                {"debate_storage_dir": tmp_path, "debate_novelty_threshold": 0.2},
+            )(),
+        )
+        mem = DebateMemory()
+        (tmp_path / "legacy.json").write_text(
+            json.dumps(
+                {
+                    "debate_id": "legacy",
+                    "topic": "database indexing strategies",
+                    "strategy": "collaborative",
+                    "rounds_completed": 1,
+                    "timestamp": "2025-01-01T00:00:00",
+                }
+            )
+        )
+        mem.save(
+            DebateResult(
+                debate_id="current",
+                topic="database indexing tradeoffs",
+                strategy=DebateStrategy.COLLABORATIVE,
+                rounds_completed=1,
+            )
+        )
+
+        related = mem.find_related_debates("database indexing", limit=5)
+        assert {r.debate_id for r in related} == {"legacy", "current"}
+        assert all("topic_tf" not in d for d in mem.get_all_debates())
+
+    def test_get_all_debates_does_not_alias_cache(self, tmp_path, monkeypatch):
+        """Mutating a returned debate leaves the cached file contents intact."""
+        monkeypatch.setattr(
+            "gemini_mcp.debate.orchestrator.config",
+            type(
+                "C",
+                (),
+                {"debate_storage_dir": tmp_path, "debate_novelty_threshold": 0.2},
+            )(),
+        )
+        mem = DebateMemory()
+        mem.save(
+            DebateResult(
+                debate_id="d1",
+                topic="caching",
+                strategy=DebateStrategy.COLLABORATIVE,
+                rounds_completed=1,
+                consensus_points=["first"],
+            )
+        )
+
+        first = mem.get_all_debates()[0]
+        first["topic"] = "changed"
+        first["consensus"].append("leaked")
+
+        again = mem.get_all_debates()[0]
+        assert again["topic"] == "caching"
+        assert again["consensus"] == ["first"]
+
+    def test_quota_prunes_oldest(self, tmp_path, monkeypatch):
+        """Saving past the quota removes the oldest debate and its index entries."""
+        import os
+
+        monkeypatch.setattr(
+            "gemini_mcp.debate.orchestrator.config",
+            type(
+                "C",
+                (),
+                {"debate_storage_dir": tmp_path, "debate_novelty_threshold": 0.2},
+            )(),
+        )
+        monkeypatch.setattr("gemini_mcp.debate.orchestrator._MAX_DEBATE_FILES", 2)
+        mem = DebateMemory()
+
+        for i, topic in enumerate(["quantum computing", "quantum networking", "quantum sensing"]):
+            mem.save(
+                DebateResult(
+                    debate_id=f"q-{i}",
+                    topic=topic,
+                    strategy=DebateStrategy.COLLABORATIVE,
+                    rounds_completed=1,
+                )
+            )
+            os.utime(tmp_path / f"q-{i}.json", (1_000_000 + i, 1_000_000 + i))
+
+        remaining = {d["debate_id"] for d in mem.get_all_debates()}
+        assert remaining == {"q-1", "q-2"}
+        related = {r.debate_id for r in mem.find_related_debates("quantum", limit=5)}
+        assert "q-0" not in related
+
+    def test_overlapping_saves_keep_both_indexed(self, tmp_path, monkeypatch):
+        """Two memories open across each other's saves don't drop index entries."""
+        monkeypatch.setattr(
+            "gemini_mcp.debate.orchestrator.config",
+            type(
+                "C",
+                (),
+                {"debate_storage_dir": tmp_path, "debate_novelty_threshold": 0.2},
+            )(),
+        )
+        first, second = DebateMemory(), DebateMemory()
+        # Each debate loads the index up front (get_context_summary).
+        assert first.find_related_debates("quantum error correction") == []
+        assert second.find_related_debates("database indexing") == []
+
+        for mem, debate_id, topic in [
+            (first, "d1", "quantum error correction"),
+            (second, "d2", "database indexing strategies"),
+        ]:
+            mem.save(
+                DebateResult(
+                    debate_id=debate_id,
+                    topic=topic,
+                    strategy=DebateStrategy.COLLABORATIVE,
+                    rounds_completed=1,
+                )
+            )
+
+        fresh = DebateMemory()
+        assert [r.debate_id for r in fresh.find_related_debates("quantum error correction")] == [
+            "d1"
+        ]
+        assert [r.debate_id for r in fresh.find_related_debates("database indexing")] == ["d2"]
+
+        # IDF statistics (N and df) come from the persisted docs alone.
+        index = fresh._load_index()
+        assert set(index.docs) == {"d1", "d2"}
+        rebuilt = _TermIndex()
+        rebuilt.add("d1", _tfidf_vector("quantum error correction"))
+        rebuilt.add("d2", _tfidf_vector("database indexing strategies"))
+        for token in ("quantum", "database", "unseen"):
+            assert index.idf(token) == pytest.approx(rebuilt.idf(token))
+
+    def test_load_sees_rewritten_file(self, tmp_path, monkeypatch):
+        """Cached debates are re-read once the file on disk changes."""
+        monkeypatch.setattr(
+            "gemini_mcp.debate.orchestrator.config",
+            type(
+                "C",
+                (),
+                {"debate_storage_dir": tmp_path, "debate_novelty_threshold": 0.2},
+            )(),
+        )
+        mem = DebateMemory()
+
+        result = DebateResult(
+            debate_id="cached",
+            topic="Caching strategies",
+            strategy=DebateStrategy.COLLABORATIVE,
+            rounds_completed=1,
+            final_synthesis="first",
+        )
+        mem.save(result)
+        assert mem.load("cached").final_synthesis == "first"
+
+        result.final_synthesis = "second, longer synthesis"
+        mem.save(result)
+        assert mem.load("cached").final_synthesis == "second, longer synthesis"
+
+    def test_catalog_picks_up_external_files(self, tmp_path, monkeypatch):
+        """Debates written by another process show up without a reindex."""
+        import json
+
+        monkeypatch.setattr(
+            "gemini_mcp.debate.orchestrator.config",
+            type(
+                "C",
+                (),
+                {"debate_storage_dir": tmp_path, "debate_novelty_threshold": 0.2},
+            )(),
+        )
+        mem = DebateMemory()
+        assert mem.get_all_debates() == []
+
+        (tmp_path / "external.json").write_text(
+            json.dumps(
+                {
+                    "debate_id": "external",
+                    "topic": "vector databases",
+                    "strategy": "collaborative",
+                    "rounds_completed": 1,
+                }
+            )
+        )
+        assert [d["debate_id"] for d in mem.get_all_debates()] == ["external"]
+        assert [r.debate_id for r in mem.find_related_debates("vector databases")] == ["external"]
+
+    def test_shared_memory_skips_rescan_of_settled_dir(self, tmp_path, monkeypatch):
+        """One memory per storage dir; an unchanged directory isn't relisted."""
+        import os
+
+        from gemini_mcp.debate import orchestrator as orch_mod
+
+        monkeypatch.setattr(
+            "gemini_mcp.debate.orchestrator.config",
+            type(
+                "C",
+                (),
+                {"debate_storage_dir": tmp_path, "debate_novelty_threshold": 0.2},
+            )(),
+        )
+        monkeypatch.setattr(orch_mod, "_memories", {})
+        mem = orch_mod.get_debate_memory()
+        assert orch_mod.get_debate_memory() is mem
+
+        mem.save(
+            DebateResult(
+                debate_id="d1",
+                topic="shared catalogs",
+                strategy=DebateStrategy.COLLABORATIVE,
+                rounds_completed=1,
+            )
+        )
+        os.utime(tmp_path, ns=(1_000_000_000, 1_000_000_000))  # long settled
+
+        scans = []
+        real_scan = mem._scan_debate_files
+        monkeypatch.setattr(mem, "_scan_debate_files", lambda: scans.append(1) or real_scan())
+        for _ in range(3):
+            assert [d["debate_id"] for d in mem.get_all_debates()] == ["d1"]
+        assert len(scans) == 1
+
 
 class TestJSONExtraction:
     """Tests for bracket-balanced JSON extraction from LLM output."""
@@ -248,3 +506,21 @@ class TestDebateRound:
         sim = _cosine_similarity(v1, v2)
         novelty = 1.0 - sim
         assert novelty > 0.9  # Very high novelty for unrelated texts
+
+    def test_novelty_window_matches_tf_cosine(self):
+        """Running counts score like TF vectors over the last two rounds."""
+        rounds = [
+            ("rust memory safety", "borrow checker ownership"),
+            ("rust ownership rules", "garbage collection tradeoffs"),
+            ("garbage collection pauses", "latency budgets"),
+            ("latency budgets matter", "memory safety wins"),
+        ]
+        window = _NoveltyWindow()
+        assert window.observe(*rounds[0]) == 1.0
+        for i in range(1, len(rounds)):
+            prev = " ".join(a + " " + b for a, b in rounds[max(0, i - 2) : i])
+            expected = 1.0 - _cosine_similarity(
+                _tfidf_vector(" ".join(rounds[i])), _tfidf_vector(prev)
+            )
+            assert window.observe(*rounds[i]) == pytest.approx(expected)
+        assert "borrow" not in window.counts
@@ -3,30 +3,100 @@
 import time
 from unittest.mock import MagicMock, patch
 
-import pytest
-
 from gemini_mcp.middleware import (
+    BearerAuthMiddleware,
     RateLimitMiddleware,
     RequestSizeLimitMiddleware,
+    _header_map,
     _TokenBucket,
     audit_event,
 )
 
 
+class TestHeaderMap:
+    """Tests for the per-request header lookup."""
+
+    def test_built_once_and_first_value_wins(self):
+        """The map is memoized on the scope; repeated headers keep the first."""
+        scope = {"headers": [(b"x-forwarded-for", b"1.1.1.1"), (b"x-forwarded-for", b"2.2.2.2")]}
+        headers = _header_map(scope)
+        assert headers[b"x-forwarded-for"] == b"1.1.1.1"
+        assert _header_map(scope) is headers
+
+
+class TestBearerAuthMiddleware:
+    """Tests for bearer token authentication."""
+
+    @staticmethod
+    def _call(headers: list, path: str = "/mcp") -> dict:
+        import asyncio
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+
+        sent: list[dict] = []
+
+        async def send(message):
+            sent.append(message)
+
+        auth = BearerAuthMiddleware(app=app, token="s3cret")
+        scope = {"type": "http", "path": path, "headers": headers}
+        asyncio.run(auth(scope, MagicMock(), send))
+        return sent[0]
+
+    def test_valid_token_case_insensitive_scheme(self):
+        """A matching token passes regardless of the scheme's case."""
+        assert self._call([(b"authorization", b"Bearer s3cret")])["status"] == 200
+        assert self._call([(b"authorization", b"bEaReR s3cret")])["status"] == 200
+
+    def test_empty_token_rejects_everything(self):
+        """A misconfigured empty token fails closed."""
+        import asyncio
+
+        app = MagicMock()
+        sent: list[dict] = []
+
+        async def send(message):
+            sent.append(message)
+
+        auth = BearerAuthMiddleware(app=app, token="")
+        scope = {"type": "http", "path": "/mcp", "headers": [(b"authorization", b"Bearer x")]}
+        asyncio.run(auth(scope, MagicMock(), send))
+        assert sent[0]["status"] == 401
+        app.assert_not_called()
+
+    def test_health_is_exempt(self):
+        """Health probes pass without credentials."""
+        assert self._call([], path="/health")["status"] == 200
+
+    def test_rejections_get_precomputed_401(self):
+        """Missing or wrong tokens get a 401 with a Bearer challenge."""
+        for headers in (
+            [],
+            [(b"authorization", b"Bearer nope")],
+            [(b"authorization", b"Bearer s3cr\xe9t")],  # non-ASCII bytes
+        ):
+            start = self._call(headers)
+            assert start["status"] == 401
+            header_map = dict(start["headers"])
+            assert header_map[b"www-authenticate"] == b"Bearer"
+            assert header_map[b"content-length"] == b"24"
+
+
 class TestTokenBucket:
     """Tests for token bucket internals."""
 
     def test_initial_capacity(self):
         """Bucket starts with full capacity."""
-        bucket = _TokenBucket(10.0)
-        assert bucket.tokens == 10.0
+        bucket = _TokenBucket(10_000)
+        assert bucket.ns_tokens == 10_000
 
     def test_last_refill_set(self):
         """Bucket records creation time."""
-        before = time.monotonic()
-        bucket = _TokenBucket(5.0)
-        after = time.monotonic()
-        assert before <= bucket.last_refill <= after
+        before = time.monotonic_ns()
+        bucket = _TokenBucket(5_000)
+        after = time.monotonic_ns()
+        assert before <= bucket.last_refill_ns <= after
 
 
 class TestRateLimitMiddleware:
@@ -37,10 +107,11 @@ class TestRateLimitMiddleware:
         limiter = RateLimitMiddleware(app=MagicMock(), rate=0, burst=20)
         assert limiter.rate == 0
 
-    def test_tokens_per_second_calculation(self):
-        """60 requests/min = 1 request/sec."""
+    def test_token_cost_calculation(self):
+        """60 requests/min = one token per second of refill."""
         limiter = RateLimitMiddleware(app=MagicMock(), rate=60, burst=10)
-        assert limiter.tokens_per_second == pytest.approx(1.0)
+        assert limiter.ns_per_token == 1_000_000_000
+        assert limiter.capacity_ns == 10 * 1_000_000_000
 
     def test_get_client_ip_direct(self):
         """Extract IP from direct connection via ASGI scope."""
@@ -62,6 +133,85 @@ class TestRateLimitMiddleware:
         ip = RateLimitMiddleware._get_client_ip(scope)
         assert ip == "10.0.0.1"
 
+    def test_bucket_lru_eviction(self, monkeypatch):
+        """Least-recently-used bucket is evicted at capacity."""
+        monkeypatch.setattr("gemini_mcp.middleware._MAX_RATE_LIMIT_BUCKETS", 2)
+        monkeypatch.setattr("gemini_mcp.middleware._RATE_LIMIT_SHARDS", 1)
+        limiter = RateLimitMiddleware(app=MagicMock(), rate=60, burst=10)
+
+        limiter._get_or_create_bucket("a")
+        limiter._get_or_create_bucket("b")
+        limiter._get_or_create_bucket("a")  # touch: "b" is now least recent
+        limiter._get_or_create_bucket("c")
+        assert list(limiter._shards[0]) == ["a", "c"]
+
+    def test_sharded_buckets_stay_bounded(self, monkeypatch):
+        """A flood of distinct IPs never grows past the total cap."""
+        monkeypatch.setattr("gemini_mcp.middleware._MAX_RATE_LIMIT_BUCKETS", 64)
+        limiter = RateLimitMiddleware(app=MagicMock(), rate=60, burst=10)
+        assert len(limiter._shards) == 16
+
+        for i in range(5_000):
+            limiter._get_or_create_bucket(f"10.0.{i // 256}.{i % 256}")
+        assert sum(len(shard) for shard in limiter._shards) <= 64
+        assert all(len(shard) <= 4 for shard in limiter._shards)
+
+    def test_idle_full_buckets_swept(self, monkeypatch):
+        """Idle buckets that have refilled are dropped when a new client arrives."""
+        monkeypatch.setattr("gemini_mcp.middleware._RATE_LIMIT_SHARDS", 1)
+        limiter = RateLimitMiddleware(app=MagicMock(), rate=60, burst=10)
+        idle = limiter._get_or_create_bucket("idle")
+        idle.last_refill_ns -= 600 * 1_000_000_000
+        drained = limiter._get_or_create_bucket("drained")
+        drained.ns_tokens = 0
+
+        limiter._get_or_create_bucket("new")
+        assert list(limiter._shards[0]) == ["drained", "new"]
+
+    def test_requests_beyond_burst_rejected(self):
+        """Burst is honoured, then clients get a 429 with Retry-After."""
+        import asyncio
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+
+        limiter = RateLimitMiddleware(app=app, rate=60, burst=2)
+        scope = {"type": "http", "path": "/mcp", "headers": [], "client": ("1.2.3.4", 1)}
+
+        async def call() -> dict:
+            sent: list[dict] = []
+
+            async def send(message):
+                sent.append(message)
+
+            await limiter(scope, MagicMock(), send)
+            return dict(sent[0]["headers"]) | {"status": sent[0]["status"]}
+
+        results = [asyncio.run(call()) for _ in range(3)]
+        assert [r["status"] for r in results] == [200, 200, 429]
+        assert results[0][b"x-ratelimit-remaining"] == b"1"
+        assert results[1][b"x-ratelimit-remaining"] == b"0"
+        assert results[2][b"retry-after"] == b"1"
+
+    def test_header_injection_can_be_disabled(self):
+        """With headers off, the app gets the original send callable."""
+        import asyncio
+
+        seen_send = []
+
+        async def app(scope, receive, send):
+            seen_send.append(send)
+
+        limiter = RateLimitMiddleware(app=app, rate=60, burst=2, headers=False)
+        scope = {"type": "http", "path": "/mcp", "headers": [], "client": ("1.2.3.4", 1)}
+
+        async def send(message):
+            pass
+
+        asyncio.run(limiter(scope, MagicMock(), send))
+        assert seen_send == [send]
+
     def test_get_client_ip_no_client(self):
         """Handle missing client info in ASGI scope."""
         scope = {
@@ -85,24 +235,130 @@ class TestRequestSizeLimitMiddleware:
         limiter = RequestSizeLimitMiddleware(app=MagicMock(), max_size=1024)
         assert limiter.max_size == 1024
 
+    def test_content_length_and_chunked_limits(self):
+        """Declared lengths are checked up front; chunked bodies as they stream."""
+        import asyncio
+
+        seen_receive = []
+
+        async def app(scope, receive, send):
+            seen_receive.append(receive)
+            while (await receive()).get("more_body"):
+                pass
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        limiter = RequestSizeLimitMiddleware(app=app, max_size=10)
+
+        def run(headers, chunks):
+            messages = iter(
+                {"type": "http.request", "body": c, "more_body": i < len(chunks) - 1}
+                for i, c in enumerate(chunks)
+            )
+            sent: list[dict] = []
+
+            async def receive():
+                return next(messages)
+
+            async def send(message):
+                sent.append(message)
+
+            scope = {"type": "http", "headers": headers}
+            asyncio.run(limiter(scope, receive, send))
+            return sent[0]["status"], receive
+
+        assert run([(b"content-length", b"50")], [b"x" * 50])[0] == 413
+        status, receive = run([(b"content-length", b"5")], [b"x" * 5])
+        assert status == 200
+        assert seen_receive[-1] is receive  # in-limit length passes straight through
+        assert run([], [b"x" * 6, b"x" * 6])[0] == 413
+        assert run([], [b"x" * 4, b"x" * 4])[0] == 200
+
+        # A small Content-Length doesn't bound a body framed by Transfer-Encoding
+        chunked = [(b"content-length", b"5"), (b"transfer-encoding", b"chunked")]
+        assert run(chunked, [b"x" * 6, b"x" * 6])[0] == 413
+        assert run(chunked, [b"x" * 4, b"x" * 4])[0] == 200
+
+    def test_content_length_digit_comparison(self):
+        """Declared lengths compare numerically without int() parsing."""
+        limiter = RequestSizeLimitMiddleware(app=MagicMock(), max_size=1000)
+        assert not limiter._exceeds_limit(b"999")
+        assert not limiter._exceeds_limit(b"1000")
+        assert limiter._exceeds_limit(b"1001")
+        assert limiter._exceeds_limit(b"20000")
+        assert not limiter._exceeds_limit(b"0000999")
+        assert not limiter._exceeds_limit(b"0")
+
 
 class TestAuditEvent:
     """Tests for audit logging."""
 
     def test_noop_when_disabled(self, monkeypatch):
         """audit_event should be a no-op when audit_log is False."""
-        monkeypatch.setattr("gemini_mcp.middleware.config.audit_log", False)
-        # Should not raise
-        audit_event("test_event", tool="test", result="ok")
+        import io
 
-    def test_logs_when_enabled(self, monkeypatch):
-        """audit_event should log when audit_log is True."""
-        monkeypatch.setattr("gemini_mcp.middleware.config.audit_log", True)
+        stream = io.BytesIO()
+        monkeypatch.setattr("gemini_mcp.middleware._AUDIT_ENABLED", False)
+        monkeypatch.setattr("gemini_mcp.middleware._audit_stream", stream)
+        from gemini_mcp.middleware import _audit_logger
 
-        from gemini_mcp.middleware import _audit_logger, _setup_audit_logger
+        with patch.object(_audit_logger, "handle") as mock_handle:
+            audit_event("test_event", tool="test", result="ok")
+            mock_handle.assert_not_called()
+        assert stream.getvalue() == b""
+
+    def test_writes_json_line_when_enabled(self, monkeypatch):
+        """audit_event writes one JSON line straight to the stream."""
+        import io
+        from datetime import datetime, timedelta
+
+        import orjson
+
+        stream = io.BytesIO()
+        monkeypatch.setattr("gemini_mcp.middleware._AUDIT_ENABLED", True)
+        monkeypatch.setattr("gemini_mcp.middleware._audit_stream", stream)
+
+        audit_event("tool_call", tool="gemini", mode="fast")
+        line = stream.getvalue()
+        assert line.endswith(b"\n") and line.count(b"\n") == 1
+        entry = orjson.loads(line)
+        assert entry["event"] == "tool_call"
+        assert entry["level"] == "INFO"
+        assert entry["tool"] == "gemini"
+        assert entry["mode"] == "fast"
+        stamp = datetime.fromisoformat(entry["timestamp"])
+        assert stamp.utcoffset() == timedelta(0)
+
+    def test_event_loop_writes_are_batched(self, monkeypatch):
+        """Events raised on the loop are written together in one call."""
+        import asyncio
+        from collections import deque
+
+        writes: list[bytes] = []
+        stream = MagicMock(write=writes.append)
+        monkeypatch.setattr("gemini_mcp.middleware._AUDIT_ENABLED", True)
+        monkeypatch.setattr("gemini_mcp.middleware._audit_stream", stream)
+        monkeypatch.setattr("gemini_mcp.middleware._audit_pending", deque(maxlen=10))
+        monkeypatch.setattr("gemini_mcp.middleware._audit_flush_loop", None)
 
-        _setup_audit_logger()
+        async def burst():
+            for i in range(3):
+                audit_event("tool_call", tool=f"t{i}")
+            assert writes == []
+            await asyncio.sleep(0.05)
 
+        asyncio.run(burst())
+        assert len(writes) == 1
+        assert writes[0].count(b"\n") == 3
+
+    def test_logs_via_external_handlers(self, monkeypatch):
+        """Without a direct stream, events go through the audit logger."""
+        monkeypatch.setattr("gemini_mcp.middleware._AUDIT_ENABLED", True)
+        monkeypatch.setattr("gemini_mcp.middleware._audit_stream", None)
+
+        from gemini_mcp.middleware import _audit_logger
+
+        monkeypatch.setattr(_audit_logger, "isEnabledFor", lambda level: True)
         with patch.object(_audit_logger, "handle") as mock_handle:
             audit_event("tool_call", tool="gemini", mode="fast")
             mock_handle.assert_called_once()
@@ -111,3 +367,30 @@ class TestAuditEvent:
             assert hasattr(record, "audit_data")
             assert record.audit_data["tool"] == "gemini"
             assert record.audit_data["mode"] == "fast"
+
+    def test_external_handlers_receive_events_at_default_level(self, monkeypatch):
+        """The logging fallback delivers INFO events when no level was set."""
+        import logging
+
+        from gemini_mcp.middleware import _audit_logger, _setup_audit_logger
+
+        records: list[logging.LogRecord] = []
+        handler = logging.Handler()
+        handler.emit = records.append  # type: ignore[method-assign]
+        monkeypatch.setattr("gemini_mcp.middleware._AUDIT_ENABLED", True)
+        monkeypatch.setattr("gemini_mcp.middleware._audit_stream", None)
+        monkeypatch.setattr(_audit_logger, "handlers", [handler])
+        original_level = _audit_logger.level
+        _audit_logger.setLevel(logging.NOTSET)
+        try:
+            _setup_audit_logger()
+            audit_event("tool_call", tool="gemini")
+            assert [r.audit_data["tool"] for r in records] == ["gemini"]
+
+            # A deliberately raised level is kept, and still filters events
+            _audit_logger.setLevel(logging.WARNING)
+            _setup_audit_logger()
+            audit_event("tool_call", tool="ignored")
+            assert len(records) == 1
+        finally:
+            _audit_logger.setLevel(original_level)
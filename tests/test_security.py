@@ -5,6 +5,7 @@ import os
 import tempfile
 from pathlib import Path
 
+from gemini_mcp.config import GeminiMCPConfig
 from gemini_mcp.tools.core import (
     _BINARY_EXTENSIONS,
     _estimate_tokens,
@@ -59,10 +60,14 @@ class TestPathValidation:
 
     def test_custom_allowed_paths(self, monkeypatch):
         """Custom GEMINI_MCP_ALLOWED_PATHS override."""
+        from gemini_mcp.config import GeminiMCPConfig
+
         monkeypatch.setenv("GEMINI_MCP_ALLOWED_PATHS", "/custom/path")
+        monkeypatch.setattr("gemini_mcp.tools.core.config", GeminiMCPConfig())
         result = _validate_path("/custom/path/file.py")
-        # Will return Path if /custom/path exists, error string otherwise
-        assert isinstance(result, (Path, str))
+        assert result == Path("/custom/path/file.py")
+        # CWD is no longer implicitly allowed once roots are configured
+        assert isinstance(_validate_path(os.path.join(os.getcwd(), "test.py")), str)
 
     def test_invalid_path(self):
         """Invalid path returns error string."""
@@ -136,6 +141,7 @@ class TestPluginSandbox:
         from gemini_mcp.server import _verify_plugin_hash
 
         monkeypatch.setenv("GEMINI_MCP_PLUGIN_REQUIRE_HASH", "true")
+        monkeypatch.setattr("gemini_mcp.server.config", GeminiMCPConfig())
 
         plugin_file = tmp_path / "test_plugin.py"
         plugin_file.write_text("# test plugin")
@@ -147,6 +153,7 @@ class TestPluginSandbox:
         from gemini_mcp.server import _verify_plugin_hash
 
         monkeypatch.setenv("GEMINI_MCP_PLUGIN_REQUIRE_HASH", "true")
+        monkeypatch.setattr("gemini_mcp.server.config", GeminiMCPConfig())
 
         plugin_file = tmp_path / "test_plugin.py"
         content = b"# secure plugin"
@@ -163,6 +170,7 @@ class TestPluginSandbox:
         from gemini_mcp.server import _verify_plugin_hash
 
         monkeypatch.setenv("GEMINI_MCP_PLUGIN_REQUIRE_HASH", "true")
+        monkeypatch.setattr("gemini_mcp.server.config", GeminiMCPConfig())
 
         plugin_file = tmp_path / "test_plugin.py"
         plugin_file.write_bytes(b"# original content")
@@ -171,3 +179,39 @@ class TestPluginSandbox:
         hash_file.write_text("deadbeef" * 8)  # wrong hash
 
         assert _verify_plugin_hash(plugin_file) is False
+
+    def test_load_plugins_skips_private_and_non_files(self, tmp_path, monkeypatch):
+        """Only top-level, non-underscore .py files are executed."""
+        from gemini_mcp.server import load_plugins
+
+        monkeypatch.setenv("PLUGIN_DIR", str(tmp_path))
+        marker = tmp_path / "loaded.txt"
+        for name in ("good.py", "_private.py"):
+            (tmp_path / name).write_text(
+                f"with open({str(marker)!r}, 'a') as f:\n    f.write({name!r} + '\\n')\n"
+            )
+        (tmp_path / "notes.txt").write_text("not a plugin")
+        (tmp_path / "pkg.py").mkdir()
+
+        load_plugins()
+        assert marker.read_text().splitlines() == ["good.py"]
+
+    def test_load_plugins_separator_only_allowlist_blocks_all(self, tmp_path, monkeypatch):
+        """An allowlist of only separators loads nothing (it is still configured)."""
+        from gemini_mcp.server import load_plugins
+
+        monkeypatch.setenv("PLUGIN_DIR", str(tmp_path))
+        monkeypatch.setenv("GEMINI_MCP_PLUGIN_ALLOWLIST", ", ,")
+        monkeypatch.setattr("gemini_mcp.server.config", GeminiMCPConfig())
+        marker = tmp_path / "loaded.txt"
+        (tmp_path / "good.py").write_text(f"open({str(marker)!r}, 'w').close()\n")
+
+        load_plugins()
+        assert not marker.exists()
+
+    def test_load_plugins_missing_dir(self, tmp_path, monkeypatch):
+        """A missing plugin directory is not an error."""
+        from gemini_mcp.server import load_plugins
+
+        monkeypatch.setenv("PLUGIN_DIR", str(tmp_path / "absent"))
+        load_plugins()
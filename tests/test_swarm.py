@@ -1,5 +1,7 @@
 """Tests for the swarm orchestrator."""
 
+import asyncio
+
 import pytest
 
 from gemini_mcp.swarm.core import SwarmOrchestrator
@@ -24,7 +26,7 @@ class TestSwarmParsing:
     def test_parse_single_delegation(self):
         """Parse a single delegate() call."""
         text = 'I need more info. delegate("researcher", "find papers on ML trading")'
-        result = self.orch._parse_delegations(text)
+        result = self.orch._parse_actions(text)[0]
         assert len(result) == 1
         assert result[0][0] == "researcher"
         assert "papers" in result[0][1]
@@ -35,7 +37,7 @@ class TestSwarmParsing:
             'delegate("coder", "implement the API endpoint")\n'
             'delegate("tester", "write unit tests for the endpoint")'
         )
-        result = self.orch._parse_delegations(text)
+        result = self.orch._parse_actions(text)[0]
         assert len(result) == 2
         assert result[0][0] == "coder"
         assert result[1][0] == "tester"
@@ -43,20 +45,26 @@ class TestSwarmParsing:
     def test_parse_delegation_no_quotes(self):
         """Parse delegate() without quotes around agent name."""
         text = "delegate(analyst, analyze the data patterns)"
-        result = self.orch._parse_delegations(text)
+        result = self.orch._parse_actions(text)[0]
         assert len(result) == 1
         assert result[0][0] == "analyst"
 
+    def test_parse_delegation_digit_leading_name(self):
+        """Agent names may start with a digit (e.g. persona stems)."""
+        text = 'delegate(3d_modeler, "build the scene")'
+        result = self.orch._parse_actions(text)[0]
+        assert result == [("3d_modeler", "build the scene")]
+
     def test_parse_no_delegation(self):
         """No delegate() calls should return empty list."""
         text = "I can answer this directly. The solution is..."
-        result = self.orch._parse_delegations(text)
+        result = self.orch._parse_actions(text)[0]
         assert result == []
 
     def test_parse_completion(self):
         """Parse complete() with result."""
         text = 'complete("The API should use REST with JWT auth")'
-        result = self.orch._parse_completion(text)
+        result = self.orch._parse_actions(text)[1]
         assert result is not None
         assert "REST" in result
         assert "JWT" in result
@@ -64,22 +72,49 @@ class TestSwarmParsing:
     def test_parse_completion_multiline(self):
         """Parse complete() spanning multiple lines."""
         text = 'complete("Line one.\nLine two.\nLine three.")'
-        result = self.orch._parse_completion(text)
+        result = self.orch._parse_actions(text)[1]
         assert result is not None
         assert "Line one" in result
 
     def test_parse_no_completion(self):
         """No complete() should return None."""
         text = "Let me delegate some tasks first."
-        result = self.orch._parse_completion(text)
+        result = self.orch._parse_actions(text)[1]
         assert result is None
 
+    def test_parse_delegation_with_parentheses(self):
+        """Task text may contain balanced parentheses."""
+        text = 'delegate(coder, "implement parse(x) for (a, b)") then delegate(tester, "t")'
+        result = self.orch._parse_actions(text)[0]
+        assert result == [("coder", "implement parse(x) for (a, b)"), ("tester", "t")]
+
+    def test_parse_delegation_unclosed_or_oversized(self):
+        """Unclosed or overlong calls are skipped without hiding later ones."""
+        text = "delegate(coder, " + "x" * 3000 + ') delegate(analyst, "ok")'
+        assert self.orch._parse_actions(text)[0] == [("analyst", "ok")]
+        assert self.orch._parse_actions("delegate(coder, (never closed")[0] == []
+
+    def test_parse_completion_stops_at_balanced_paren(self):
+        """Trailing text after complete(...) is not swallowed."""
+        text = 'complete("Use f(x) here") and some notes (ignore these)'
+        assert self.orch._parse_actions(text)[1] == "Use f(x) here"
+        # Never balanced: falls back to the last ")" in the text
+        assert self.orch._parse_actions('complete("a (b") done)')[1] == 'a (b") done'
+
+    def test_parse_actions_single_pass(self):
+        """A complete() inside a delegate task is not an action; the real one is."""
+        text = (
+            'delegate(coder, "complete(the form)")\ncomplete("shipped")\ndelegate(tester, "late")'
+        )
+        delegations, completion = self.orch._parse_actions(text)
+        assert delegations == [("coder", "complete(the form)")]
+        assert completion == "shipped"
+
     def test_build_architect_prompt_basic(self):
         """Build a basic architect prompt."""
         prompt = self.orch._build_architect_prompt(
-            objective="Design an API",
-            context="",
-            agent_results={},
+            prefix=self.orch._build_prompt_prefix("Design an API", ""),
+            results="",
             turn=1,
             max_turns=10,
         )
@@ -91,9 +126,8 @@ class TestSwarmParsing:
     def test_build_architect_prompt_with_results(self):
         """Build prompt including prior agent results."""
         prompt = self.orch._build_architect_prompt(
-            objective="Build a feature",
-            context="Use Python",
-            agent_results={"researcher": "Found 3 relevant papers"},
+            prefix=self.orch._build_prompt_prefix("Build a feature", "Use Python"),
+            results=self.orch._format_agent_result("researcher", "Found 3 relevant papers"),
             turn=2,
             max_turns=5,
         )
@@ -102,6 +136,256 @@ class TestSwarmParsing:
         assert "Use Python" in prompt
 
 
+class _FakeClient:
+    """Stand-in Gemini client: sleeps, then echoes back a canned reply."""
+
+    default_model = "test-model"
+
+    def __init__(self, replies, delay=0.0):
+        self.replies = replies  # callable(prompt) -> text
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate(self, request):
+        from gemini_mcp.core.response import GeminiResponse
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            return GeminiResponse(text=self.replies(request.prompt))
+        finally:
+            self.in_flight -= 1
+
+
+class _FakeTraceStore:
+    def __init__(self):
+        self.saved = []
+
+    def save(self, trace):
+        self.saved.append(trace)
+
+
+def _make_orchestrator(client):
+    from gemini_mcp.swarm.agents import AgentRegistry
+
+    orch = SwarmOrchestrator.__new__(SwarmOrchestrator)
+    orch.registry = AgentRegistry()
+    orch.trace_store = _FakeTraceStore()
+    orch.swarm_registry = SwarmRegistry()
+    orch.client = client
+    orch.max_depth = 3
+    return orch
+
+
+class TestSwarmMission:
+    """Tests for the mission loop against a fake client."""
+
+    async def test_delegations_run_concurrently(self):
+        """Delegations from one turn are in flight together; results keep order."""
+
+        def replies(prompt):
+            if prompt.startswith("Mission context:"):
+                return "done: " + prompt.split("Your task: ", 1)[1].split("\n", 1)[0]
+            if "Results from delegated agents" in prompt:
+                return 'complete("all done")'
+            return 'delegate("coder", "write it")\ndelegate("tester", "test it")'
+
+        client = _FakeClient(replies, delay=0.05)
+        orch = _make_orchestrator(client)
+        trace = ExecutionTrace(trace_id="t1", objective="Ship", status=TaskStatus.IN_PROGRESS)
+
+        result = await orch._run_mission(trace, "")
+
+        assert result.status == TaskStatus.COMPLETED
+        assert result.result == "all done"
+        assert client.max_in_flight == 2
+        delegated = [m for m in trace.messages if m.agent_type != AgentType.ARCHITECT]
+        assert [m.content for m in delegated] == ["done: write it", "done: test it"]
+        assert {AgentType.CODER, AgentType.TESTER} <= set(result.agents_used)
+
+    async def test_identical_delegations_are_deduplicated(self):
+        """Repeated (agent, task) pairs reuse one sub-agent call per mission."""
+        sub_calls = []
+
+        def replies(prompt):
+            if prompt.startswith("Mission context:"):
+                sub_calls.append(prompt)
+                return "papers found"
+            if "Turn 3/" in prompt:
+                return 'complete("done")'
+            return 'delegate(researcher, "find papers")\ndelegate(researcher, "find papers")'
+
+        orch = _make_orchestrator(_FakeClient(replies))
+        trace = ExecutionTrace(trace_id="t3", objective="Survey", status=TaskStatus.IN_PROGRESS)
+
+        result = await orch._run_mission(trace, "")
+
+        assert result.result == "done"
+        assert len(sub_calls) == 1
+        delegated = [m for m in trace.messages if m.agent_type == AgentType.RESEARCHER]
+        assert [m.content for m in delegated] == ["papers found"] * 4
+
+    async def test_old_results_fall_back_to_summary(self, monkeypatch):
+        """Results beyond the history window are excerpted, newest kept whole."""
+        from gemini_mcp.config import GeminiMCPConfig
+        from gemini_mcp.swarm import core
+
+        monkeypatch.setattr(core, "config", GeminiMCPConfig(swarm_history_window=1))
+        prompts = []
+
+        def replies(prompt):
+            if prompt.startswith("Mission context:"):
+                task = prompt.split("Your task: ", 1)[1].split("\n", 1)[0]
+                return f"{task} result " + "x" * 600
+            prompts.append(prompt)
+            if len(prompts) == 3:
+                return 'complete("done")'
+            return f'delegate(coder, "step {len(prompts)}")'
+
+        orch = _make_orchestrator(_FakeClient(replies))
+        trace = ExecutionTrace(trace_id="t4", objective="Build", status=TaskStatus.IN_PROGRESS)
+        await orch._run_mission(trace, "")
+
+        last = prompts[-1]
+        summary, results = last.split("--- Results from delegated agents ---")
+        assert "[Earlier results summary]:\n- [coder]: step 1 result" in summary
+        assert "x" * 600 not in summary
+        assert "step 1" not in results
+        assert "step 2 result " + "x" * 600 in results
+
+    async def test_exhausted_turns_return_last_architect_result(self):
+        """When turns run out, the newest self-delegated architect result wins."""
+        calls = []
+
+        def replies(prompt):
+            if prompt.startswith("Mission context:"):
+                calls.append(prompt)
+                return f"draft {len(calls)}"
+            turn = prompt.split("\n\nTurn ", 1)[1].split("/", 1)[0]
+            return f'delegate("architect", "refine the draft, pass {turn}")'
+
+        orch = _make_orchestrator(_FakeClient(replies))
+        trace = ExecutionTrace(trace_id="t2", objective="Plan", status=TaskStatus.IN_PROGRESS)
+
+        result = await orch._run_mission(trace, "")
+
+        assert result.total_turns == len(calls)
+        assert result.tasks_completed == len(calls)
+        assert result.result == f"draft {len(calls)}"
+
+    async def test_adjudication_votes_run_concurrently(self):
+        """Panel members are queried together; votes stay in panel order."""
+
+        def replies(prompt):
+            if prompt.startswith("As the presiding judge"):
+                return '{"verdict": "ship", "confidence": 0.7}'
+            return '{"position": "yes", "confidence": 0.9}'
+
+        client = _FakeClient(replies, delay=0.05)
+        orch = _make_orchestrator(client)
+        progress = []
+
+        async def on_progress(pct, message):
+            progress.append(message)
+
+        result = await orch.adjudicate(
+            "Ship it?", ["reviewer", "coder", "tester"], progress_callback=on_progress
+        )
+
+        assert client.max_in_flight == 3
+        assert [v.agent_type for v in result.panel_votes] == [
+            AgentType.REVIEWER,
+            AgentType.CODER,
+            AgentType.TESTER,
+        ]
+        assert all(v.confidence == 0.9 for v in result.panel_votes)
+        assert result.confidence == 0.7
+        assert sum("has voted" in m for m in progress) == 3
+
+
+class TestAgentRegistry:
+    """Tests for the built-in agent registry."""
+
+    def test_builtins_built_on_first_use(self):
+        """Built-in definitions are created lazily and then reused."""
+        from gemini_mcp.swarm.agents import AgentDefinition, AgentRegistry
+
+        registry = AgentRegistry()
+        assert "Coder" in registry.list_agents()
+        assert not any(isinstance(a, AgentDefinition) for a in registry._agents.values())
+
+        coder = registry.get(AgentType.CODER)
+        assert isinstance(coder, AgentDefinition)
+        assert coder.name == "Coder"
+        assert registry.get(AgentType.CODER) is coder
+        assert registry.get_by_name("coder") is coder
+
+    def test_get_by_name_follows_reregistration(self):
+        """Replacing a built-in type re-keys the name lookup."""
+        from gemini_mcp.swarm.agents import AgentDefinition, AgentRegistry
+
+        registry = AgentRegistry()
+        lead = AgentDefinition(AgentType.ARCHITECT, "Lead", "Design", "You lead.")
+        registry.register(lead, replace=True)
+        assert registry.get_by_name("LEAD") is lead
+        with pytest.raises(ValueError):
+            registry.get_by_name("architect")
+
+    def test_list_agents_tracks_registration(self):
+        """The cached name list is refreshed when agents are registered."""
+        from gemini_mcp.swarm.agents import AgentDefinition, AgentRegistry
+
+        registry = AgentRegistry()
+        before = registry.list_agents()
+        assert "Architect" in before
+        before.append("mutated")  # callers get a copy
+        assert "mutated" not in registry.list_agents()
+
+        lead = AgentDefinition(AgentType.ARCHITECT, "Lead", "Design", "You lead.")
+        registry.register(lead, replace=True)
+        helper = AgentDefinition(AgentType.ANALYST, "Helper", "Help", "You help.")
+        registry.register_custom("helper", helper)
+        names = registry.list_agents()
+        assert "Architect" not in names
+        assert names[0] == "Lead"
+        assert names[-1] == "Helper"
+
+    def test_concurrent_custom_registration(self):
+        """Registering from many threads loses no personas."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from gemini_mcp.swarm.agents import AgentDefinition, AgentRegistry
+
+        registry = AgentRegistry()
+
+        def add(i):
+            agent = AgentDefinition(AgentType.ANALYST, f"P{i}", "Role", "Prompt")
+            registry.register_custom(f"p{i}", agent)
+            return registry.list_agents()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(add, range(200)))
+
+        assert len(registry.list_custom_agents()) == 200
+        assert len(registry.list_agents()) == 200 + len(AgentType)
+
+    def test_register_requires_replace_to_override(self):
+        """Taken types need replace=True; re-registering the same object is a no-op."""
+        from gemini_mcp.swarm.agents import AgentDefinition, AgentRegistry
+
+        registry = AgentRegistry()
+        lead = AgentDefinition(AgentType.ARCHITECT, "Lead", "Design", "You lead.")
+        with pytest.raises(ValueError, match="replace=True"):
+            registry.register(lead)
+        assert registry.get(AgentType.ARCHITECT).name == "Architect"
+
+        registry.register(lead, replace=True)
+        registry.register(lead)
+        assert registry.get(AgentType.ARCHITECT) is lead
+
+
 class TestPersonaLoader:
     """Tests for custom persona loading from markdown files."""
 
@@ -128,11 +412,49 @@ class TestPersonaLoader:
         assert "test specialist" in agent.system_prompt
         assert "analyze" in agent.tools
 
+    def test_load_many_keeps_order_and_skips_bad_files(self, tmp_path):
+        """Parallel parsing still registers in filename order; bad files are skipped."""
+        from gemini_mcp.swarm.agents import AgentRegistry
+
+        for i in range(12):
+            (tmp_path / f"p{i:02d}.md").write_text(f"# Persona {i:02d}\n\n## Role\nRole {i}.\n")
+        (tmp_path / "p05.md").write_bytes(b"# Broken\n\n## Role\n\xff\xfe not utf-8\n")
+
+        registry = AgentRegistry()
+        assert registry.load_personas_from_dir(tmp_path) == 11
+        assert registry.list_custom_agents() == [f"Persona {i:02d}" for i in range(12) if i != 5]
+
+    def test_load_reuses_cache_until_source_changes(self, tmp_path, monkeypatch):
+        """Warm loads come from .cache/; an edited file is parsed again."""
+        from gemini_mcp.swarm import agents
+
+        persona_file = tmp_path / "cached.md"
+        persona_file.write_text("# Cached\n\n## Role\nFirst.\n\n## Tools\n- search\n")
+        assert agents.AgentRegistry().load_personas_from_dir(tmp_path) == 1
+        assert (tmp_path / ".cache" / "cached.json").is_file()
+
+        def fail(path):
+            raise AssertionError("cache should have been used")
+
+        monkeypatch.setattr(agents, "_parse_persona_file", fail)
+        registry = agents.AgentRegistry()
+        assert registry.load_personas_from_dir(tmp_path) == 1
+        agent = registry.get_by_name("cached")
+        assert agent.role == "First."
+        assert agent.tools == ("search",)
+
+        monkeypatch.undo()
+        persona_file.write_text("# Cached\n\n## Role\nSecond, and longer.\n")
+        registry = agents.AgentRegistry()
+        registry.load_personas_from_dir(tmp_path)
+        assert registry.get_by_name("cached").role == "Second, and longer."
+
     def test_load_skips_readme(self, tmp_path):
-        """README.md should be skipped."""
+        """README, LICENSE, CHANGELOG and template files should be skipped."""
         from gemini_mcp.swarm.agents import AgentRegistry
 
-        (tmp_path / "README.md").write_text("# Not a persona")
+        for name in ("README.md", "LICENSE.md", "Changelog.md", "template.md"):
+            (tmp_path / name).write_text("# Not a persona")
         registry = AgentRegistry()
         count = registry.load_personas_from_dir(tmp_path)
         assert count == 0